@@ -18,12 +18,18 @@ Output structure:
       ├── certificates [3 outer ML signer certs]
       └── crls [1 Colombia CRL, 15 revoked entries]
 
+The envelope is assembled by splicing the original DER bytes under
+hand-written SEQUENCE/SET headers; asn1crypto is only used to read the
+source Master Lists and, with --validate, to round-trip the result once.
+
 Usage:
-  python scripts/build_composite_fixture.py
+  python scripts/build_composite_fixture.py [--validate]
 """
 
 from __future__ import annotations
 
+import argparse
+from functools import lru_cache
 from pathlib import Path
 
 from asn1crypto import cms, core
@@ -49,8 +55,21 @@ class _CscaMasterList(core.Sequence):  # type: ignore[misc]
     ]
 
 
+@lru_cache
 def _extract_certs_from_ml(ml_path: Path) -> tuple[list[bytes], bytes | None]:
-    """Extract inner cert DERs and one outer cert DER from a Master List .bin."""
+    """
+    Extract inner cert DERs and one outer cert DER from a Master List .bin.
+
+    Memoized per path for the life of the process, so a Master List used more
+    than once in a build is only parsed by asn1crypto once.
+    """
+    return _parse_certs_from_ml(ml_path)
+
+
+def _parse_certs_from_ml(ml_path: Path) -> tuple[list[bytes], bytes | None]:
+    """Parse a Master List .bin with asn1crypto and pull out the certificate DERs."""
+    # asn1crypto's load() only accepts bytes (TypeError for mmap/memoryview), so an
+    # mmap would just add a second copy; one read_bytes() is already the minimum.
     data = ml_path.read_bytes()
     ci = cms.ContentInfo.load(data)
     sd = ci["content"]
@@ -68,7 +87,90 @@ def _extract_certs_from_ml(ml_path: Path) -> tuple[list[bytes], bytes | None]:
     return inner_ders, outer_der
 
 
-def build_composite() -> Path:
+# ─── Hand-rolled DER encoding ───
+#
+# Every certificate and CRL we splice in is already valid DER, so there is no
+# need to round-trip them through asn1crypto constructors (load → dump re-walks
+# and re-serializes every node). We only emit the few enclosing headers.
+
+_OID_SIGNED_DATA = b"\x06\x09\x2a\x86\x48\x86\xf7\x0d\x01\x07\x02"  # 1.2.840.113549.1.7.2
+_OID_ICAO_MASTER_LIST = b"\x06\x06\x67\x81\x08\x01\x01\x02"  # 2.23.136.1.1.2
+_OID_SHA256 = b"\x06\x09\x60\x86\x48\x01\x65\x03\x04\x02\x01"  # 2.16.840.1.101.3.4.2.1
+
+
+def _der_len(length: int) -> bytes:
+    """Encode a DER length (short form below 128, long form otherwise)."""
+    if length < 0x80:
+        return bytes((length,))
+    body = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes((0x80 | len(body),)) + body
+
+
+def _der_tlv(tag: int, items: list[bytes]) -> bytes:
+    """Emit tag || length || concatenated items."""
+    body = b"".join(items)
+    return bytes((tag,)) + _der_len(len(body)) + body
+
+
+def _der_seq(items: list[bytes]) -> bytes:
+    """DER SEQUENCE wrapping already-encoded items."""
+    return _der_tlv(0x30, items)
+
+
+def _der_set_of(items: list[bytes]) -> bytes:
+    """
+    DER SET OF wrapping already-encoded items, in canonical order.
+
+    DER orders SET OF members by their encodings; every member here shares the
+    same tag, so a plain bytes sort of the full TLVs is the canonical order.
+    """
+    return _der_tlv(0x31, sorted(items))
+
+
+def _build_envelope(
+    inner_ders: list[bytes],
+    outer_ders: list[bytes],
+    crl_ders: list[bytes],
+) -> bytes:
+    """Splice pre-encoded DERs into a ContentInfo(SignedData) envelope."""
+    master_list = _der_seq([b"\x02\x01\x00", _der_set_of(inner_ders)])
+
+    signed_data = _der_seq([
+        b"\x02\x01\x03",  # version v3
+        _der_set_of([_der_seq([_OID_SHA256, b"\x05\x00"])]),  # sha256, NULL params
+        _der_seq([
+            _OID_ICAO_MASTER_LIST,
+            _der_tlv(0xA0, [_der_tlv(0x04, [master_list])]),  # [0] EXPLICIT OCTET STRING
+        ]),
+        _der_tlv(0xA0, outer_ders),  # certificates [0] IMPLICIT
+        _der_tlv(0xA1, crl_ders),  # crls [1] IMPLICIT
+        _der_set_of([]),  # signerInfos
+    ])
+
+    return _der_seq([_OID_SIGNED_DATA, _der_tlv(0xA0, [signed_data])])
+
+
+def _validate_envelope(
+    composite_bin: bytes,
+    inner_count: int,
+    outer_count: int,
+    crl_count: int,
+) -> None:
+    """Round-trip the envelope through asn1crypto once to confirm it parses cleanly."""
+    ci = cms.ContentInfo.load(composite_bin)
+    sd = ci["content"]
+    ml = _CscaMasterList.load(sd["encap_content_info"]["content"].native)
+
+    if ml.dump(force=True) != sd["encap_content_info"]["content"].native:
+        raise ValueError("Master List cert_list is not in canonical DER order")
+
+    counts = (len(ml["cert_list"]), len(sd["certificates"]), len(sd["crls"]))
+    if counts != (inner_count, outer_count, crl_count):
+        raise ValueError(f"Envelope round-trip mismatch: {counts}")
+    print("  ✓ asn1crypto round-trip validated")
+
+
+def build_composite(validate: bool = False) -> Path:
     """Build the composite CMS fixture and return the output path."""
     # Gather certs from multiple countries
     all_inner_ders: list[bytes] = []
@@ -83,42 +185,11 @@ def build_composite() -> Path:
     # Load real CRL
     crl_der = (FIXTURES_DIR / CRL_FILE).read_bytes()
 
-    # Build CscaMasterList inner content
-    cert_set = _CertificateSet(
-        [asn1_x509.Certificate.load(d) for d in all_inner_ders]
-    )
-    master_list = _CscaMasterList({"version": 0, "cert_list": cert_set})
-    inner_content_bytes = master_list.dump()
-
-    # Build CMS envelope
-    certs = cms.CertificateSet()
-    for der in outer_ders:
-        certs.append(cms.CertificateChoices.load(der))
-
-    crls = cms.RevocationInfoChoices()
-    crls.append(cms.RevocationInfoChoice.load(crl_der))
-
-    signed_data = cms.SignedData({
-        "version": "v3",
-        "digest_algorithms": cms.DigestAlgorithms([
-            cms.DigestAlgorithm({"algorithm": "sha256"}),
-        ]),
-        "encap_content_info": cms.EncapsulatedContentInfo({
-            "content_type": "2.23.136.1.1.2",
-            "content": core.ParsableOctetString(inner_content_bytes),
-        }),
-        "certificates": certs,
-        "crls": crls,
-        "signer_infos": cms.SignerInfos([]),
-    })
-
-    content_info = cms.ContentInfo({
-        "content_type": "signed_data",
-        "content": signed_data,
-    })
+    composite_bin = _build_envelope(all_inner_ders, outer_ders, [crl_der])
+    if validate:
+        _validate_envelope(composite_bin, len(all_inner_ders), len(outer_ders), 1)
 
     output_path = FIXTURES_DIR / OUTPUT_FILE
-    composite_bin = content_info.dump()
     output_path.write_bytes(composite_bin)
 
     print(f"✓ {output_path} ({len(composite_bin)} bytes)")
@@ -129,4 +200,12 @@ def build_composite() -> Path:
 
 
 if __name__ == "__main__":
-    build_composite()
+    arg_parser = argparse.ArgumentParser(
+        description="Build a composite CMS/PKCS#7 SignedData fixture for testing.",
+    )
+    arg_parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="round-trip the envelope through asn1crypto to confirm it parses cleanly",
+    )
+    build_composite(validate=arg_parser.parse_args().validate)
@@ -21,7 +21,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class LdifEntry:
     """A single LDIF entry (dn + attributes)."""
 
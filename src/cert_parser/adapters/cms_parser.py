@@ -19,6 +19,7 @@ cryptography handles X.509 metadata extraction (best-in-class typed API).
 
 from __future__ import annotations
 
+import sys
 import uuid
 import warnings
 
@@ -26,7 +27,7 @@ import structlog
 from asn1crypto import cms, core
 from asn1crypto import x509 as asn1_x509
 from cryptography import x509
-from cryptography.x509.extensions import ExtensionNotFound
+from cryptography.x509.oid import CRLEntryExtensionOID, ExtensionOID
 from railway import ErrorCode
 from railway.result import Result
 
@@ -51,6 +52,10 @@ warnings.filterwarnings(
 
 log = structlog.get_logger()
 
+# Source tag stamped on every record parsed from a Master List. A single module-level
+# str, so every record in a payload references the same object.
+SOURCE_ICAO_MASTERLIST = "icao-masterlist"
+
 # ─────────────────────── ICAO ASN.1 Schema ───────────────────────
 # OID: 2.23.136.1.1.2 (id-icao-mrtd-security-masterlist)
 #
@@ -78,24 +83,43 @@ class _CscaMasterList(core.Sequence):  # type: ignore[misc]
 # ─────────────────────── X.509 Metadata Extraction ───────────────────────
 
 
-def _extract_ski(cert: x509.Certificate) -> str | None:
-    """Extract Subject Key Identifier extension as hex string, or None if absent."""
+_SKI_OID = ExtensionOID.SUBJECT_KEY_IDENTIFIER
+_AKI_OID = ExtensionOID.AUTHORITY_KEY_IDENTIFIER
+_CRL_REASON_OID = CRLEntryExtensionOID.CRL_REASON
+
+
+def _find_extension(
+    owner: x509.Certificate | x509.RevokedCertificate,
+    oid: x509.ObjectIdentifier,
+) -> x509.ExtensionType | None:
+    """
+    Return the value of the extension with the given OID, or None if absent.
+
+    A single pass over the (short) extension list — an absent extension is the
+    common case for many ICAO certificates, so it must not cost an exception.
+    Malformed or duplicate extensions (ValueError from cryptography) yield None.
+    """
     try:
-        ext = cert.extensions.get_extension_for_class(x509.SubjectKeyIdentifier)
-        return ext.value.digest.hex()
-    except ExtensionNotFound, ValueError:
+        extensions = owner.extensions
+    except ValueError:
         return None
+    return next((ext.value for ext in extensions if ext.oid == oid), None)
+
+
+def _extract_ski(cert: x509.Certificate) -> str | None:
+    """Extract Subject Key Identifier extension as hex string, or None if absent."""
+    ski = _find_extension(cert, _SKI_OID)
+    if isinstance(ski, x509.SubjectKeyIdentifier):
+        return ski.digest.hex()
+    return None
 
 
 def _extract_aki(cert: x509.Certificate) -> str | None:
     """Extract Authority Key Identifier extension as hex string, or None if absent."""
-    try:
-        ext = cert.extensions.get_extension_for_class(x509.AuthorityKeyIdentifier)
-        if ext.value.key_identifier is not None:
-            return ext.value.key_identifier.hex()
-        return None
-    except ExtensionNotFound, ValueError:
-        return None
+    aki = _find_extension(cert, _AKI_OID)
+    if isinstance(aki, x509.AuthorityKeyIdentifier) and aki.key_identifier is not None:
+        return aki.key_identifier.hex()
+    return None
 
 
 def _extract_master_list_issuer(signed_data: cms.SignedData) -> str | None:
@@ -160,7 +184,9 @@ def _der_to_certificate_record(
         warnings.simplefilter("always", DeprecationWarning)
         cert = x509.load_der_x509_certificate(der_bytes)
 
-    issuer_str = cert.issuer.rfc4514_string()
+    # Interned: a Master List repeats the same few hundred issuer DNs across
+    # thousands of certificates, so the records share one str per issuer.
+    issuer_str = sys.intern(cert.issuer.rfc4514_string())
     x500_issuer_bytes = cert.issuer.public_bytes()
     serial_hex = hex(cert.serial_number)
     ski = _extract_ski(cert)
@@ -261,12 +287,8 @@ def _build_revoked_record(
     country: str | None,
 ) -> RevokedCertificateRecord:
     """Build a RevokedCertificateRecord from a single revoked certificate entry."""
-    reason = None
-    try:
-        reason_ext = revoked_cert.extensions.get_extension_for_class(x509.CRLReason)
-        reason = reason_ext.value.reason.value
-    except ExtensionNotFound, ValueError:
-        pass
+    crl_reason = _find_extension(revoked_cert, _CRL_REASON_OID)
+    reason = crl_reason.reason.value if isinstance(crl_reason, x509.CRLReason) else None
 
     return RevokedCertificateRecord(
         source=source,
@@ -361,7 +383,7 @@ class CmsMasterListParser:
 
         This is the only method that performs actual I/O-like work.
         """
-        source = "icao-masterlist"
+        source = SOURCE_ICAO_MASTERLIST
 
         # Step 1: Load CMS ContentInfo
         content_info = cms.ContentInfo.load(raw_bin)
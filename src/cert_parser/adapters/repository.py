@@ -7,7 +7,7 @@ for sync PostgreSQL access with parameterized queries.
 Uses TRANSACTIONAL REPLACE pattern:
   1. BEGIN transaction
   2. DELETE all rows (FK-safe order: child → parent)
-  3. INSERT all rows from the MasterListPayload
+  3. COPY all rows from the MasterListPayload
   4. COMMIT (or automatic ROLLBACK on failure → old data preserved)
 
 Table mapping:
@@ -16,15 +16,30 @@ Table mapping:
   CrlRecord          → crls table
   RevokedCertificateRecord → revoked_certificate_list table
 
+Each table is written with a single binary COPY ... FROM STDIN, streaming every
+row in one statement instead of one INSERT per row. Binary format sends bytea
+as raw bytes (text COPY would hex-encode it, doubling the payload). Aware
+datetimes are stored as naive UTC in the TIMESTAMP WITHOUT TIME ZONE columns.
+
+Connections come from a psycopg_pool.ConnectionPool when one is injected
+(the composition root opens it at startup, so a bad DSN fails fast and each
+run skips the connect/auth handshake); otherwise each store() opens its own.
+
 No ORM — raw parameterized SQL for maximum control and transparency.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Any
 
 import psycopg
 import structlog
+from psycopg_pool import ConnectionPool
 from railway import ErrorCode
 from railway.result import Result
 
@@ -37,30 +52,92 @@ from cert_parser.domain.models import (
 
 log = structlog.get_logger()
 
-_INSERT_ROOT_CA = """
-INSERT INTO certs.root_ca (
-    id, certificate, subject_key_identifier, authority_key_identifier,
-    issuer, master_list_issuer, x_500_issuer, source, isn, updated_at
-) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-"""
+# Column name → PostgreSQL type, in the order shared by each COPY statement and
+# its row getter. Binary COPY needs the types up front (set_types), and sends
+# bytea as raw bytes instead of hex text. The record attribute names match the
+# column names, so attrgetter builds each row straight from the dataclass.
+_ROOT_CA_COLUMNS = {
+    "id": "uuid",
+    "certificate": "bytea",
+    "subject_key_identifier": "text",
+    "authority_key_identifier": "text",
+    "issuer": "text",
+    "master_list_issuer": "text",
+    "x_500_issuer": "bytea",
+    "source": "text",
+    "isn": "text",
+    "updated_at": "timestamp",
+}
+_DSC_COLUMNS = {
+    name: pg_type for name, pg_type in _ROOT_CA_COLUMNS.items() if name != "master_list_issuer"
+}
+_CRL_COLUMNS = {
+    "id": "uuid",
+    "crl": "bytea",
+    "source": "text",
+    "issuer": "text",
+    "country": "text",
+    "updated_at": "timestamp",
+}
+_REVOKED_COLUMNS = {
+    "id": "uuid",
+    "source": "text",
+    "country": "text",
+    "isn": "text",
+    "crl": "uuid",
+    "revocation_reason": "text",
+    "revocation_date": "timestamp",
+    "updated_at": "timestamp",
+}
 
-_INSERT_DSC = """
-INSERT INTO certs.dsc (
-    id, certificate, subject_key_identifier, authority_key_identifier,
-    issuer, x_500_issuer, source, isn, updated_at
-) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-"""
 
-_INSERT_CRL = """
-INSERT INTO certs.crls (id, crl, source, issuer, country, updated_at)
-VALUES (%s, %s, %s, %s, %s, %s)
-"""
+@dataclass(frozen=True, slots=True)
+class _CopyTarget:
+    """One table's binary COPY statement, column types and row getter."""
 
-_INSERT_REVOKED = """
-INSERT INTO certs.revoked_certificate_list (
-    id, source, country, isn, crl, revocation_reason, revocation_date, updated_at
-) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-"""
+    statement: str
+    types: tuple[str, ...]
+    row: Callable[[object], tuple[Any, ...]]
+
+
+def _copy_target(table: str, columns: dict[str, str]) -> _CopyTarget:
+    """Build the binary COPY statement, type list and row getter for one table."""
+    get = attrgetter(*columns)
+    # The columns are TIMESTAMP WITHOUT TIME ZONE holding UTC; binary COPY
+    # cannot send an aware datetime to them, so convert those values first.
+    timestamps = [i for i, pg_type in enumerate(columns.values()) if pg_type == "timestamp"]
+
+    def row(record: object) -> tuple[Any, ...]:
+        values: tuple[Any, ...] = get(record)
+        if any(_is_aware(values[i]) for i in timestamps):
+            fixed = list(values)
+            for i in timestamps:
+                fixed[i] = _naive_utc(fixed[i])
+            return tuple(fixed)
+        return values
+
+    return _CopyTarget(
+        statement=f"COPY {table} ({', '.join(columns)}) FROM STDIN (FORMAT BINARY)",
+        types=tuple(columns.values()),
+        row=row,
+    )
+
+
+def _is_aware(value: datetime | None) -> bool:
+    return value is not None and value.tzinfo is not None
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    """Convert an aware datetime to naive UTC; naive values and None pass through."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+_ROOT_CA = _copy_target("certs.root_ca", _ROOT_CA_COLUMNS)
+_DSC = _copy_target("certs.dsc", _DSC_COLUMNS)
+_CRL = _copy_target("certs.crls", _CRL_COLUMNS)
+_REVOKED = _copy_target("certs.revoked_certificate_list", _REVOKED_COLUMNS)
 
 
 class PsycopgCertificateRepository:
@@ -71,8 +148,9 @@ class PsycopgCertificateRepository:
     All exceptions are caught at this adapter boundary via Result.from_computation().
     """
 
-    def __init__(self, dsn: str) -> None:
+    def __init__(self, dsn: str, pool: ConnectionPool[Any] | None = None) -> None:
         self._dsn = dsn
+        self._pool = pool
 
     def store(self, payload: MasterListPayload) -> Result[int]:
         """
@@ -80,6 +158,7 @@ class PsycopgCertificateRepository:
 
         Returns Result[int] with total rows affected on success.
         On failure, old data remains intact (transaction rolled back).
+        Concurrent readers are never blocked; they see the old data until commit.
         """
         return Result.from_computation(
             lambda: self._transactional_replace(payload),
@@ -87,14 +166,23 @@ class PsycopgCertificateRepository:
             "Failed to persist certificates to database",
         )
 
+    def close(self) -> None:
+        """Close the connection pool, if one was injected."""
+        if self._pool is not None:
+            self._pool.close()
+
     def _transactional_replace(self, payload: MasterListPayload) -> int:
         """
-        DELETE all → INSERT all in a single ACID transaction.
+        DELETE all → COPY all in a single ACID transaction.
 
         If any exception occurs, psycopg rolls back automatically
         and the old data remains intact.
         """
-        with psycopg.connect(self._dsn) as conn, conn.transaction(), conn.cursor() as cur:
+        with (
+            self._connect() as conn,
+            conn.transaction(),
+            conn.cursor() as cur,
+        ):
             self._delete_all(cur)
             rows = self._insert_all(cur, payload)
             log.info(
@@ -107,15 +195,28 @@ class PsycopgCertificateRepository:
             )
             return rows
 
+    def _connect(self) -> AbstractContextManager[psycopg.Connection[Any]]:
+        """Borrow a pooled connection, or open a fresh one when there is no pool."""
+        if self._pool is not None:
+            return self._pool.connection()
+        return psycopg.connect(self._dsn)
+
     def _delete_all(self, cur: psycopg.Cursor[Any]) -> None:
-        """Delete all rows in FK-safe order: child → parent."""
+        """
+        Delete all rows in FK-safe order: child → parent.
+
+        DELETE rather than TRUNCATE: TRUNCATE would hold an ACCESS EXCLUSIVE
+        lock on all four tables until COMMIT, blocking every reader for the
+        whole refresh. With DELETE, readers keep seeing the old rows (MVCC)
+        until the new ones commit.
+        """
         cur.execute("DELETE FROM certs.revoked_certificate_list")
         cur.execute("DELETE FROM certs.crls")
         cur.execute("DELETE FROM certs.dsc")
         cur.execute("DELETE FROM certs.root_ca")
 
     def _insert_all(self, cur: psycopg.Cursor[Any], payload: MasterListPayload) -> int:
-        """Insert all records from the payload, returning total row count."""
+        """Copy all records from the payload, returning total row count."""
         rows = 0
         rows += self._insert_root_cas(cur, payload.root_cas)
         rows += self._insert_dscs(cur, payload.dscs)
@@ -129,23 +230,7 @@ class PsycopgCertificateRepository:
         certs: list[CertificateRecord],
     ) -> int:
         """Insert root CA certificate records (includes master_list_issuer)."""
-        for cert in certs:
-            cur.execute(
-                _INSERT_ROOT_CA,
-                (
-                    cert.id,
-                    cert.certificate,
-                    cert.subject_key_identifier,
-                    cert.authority_key_identifier,
-                    cert.issuer,
-                    cert.master_list_issuer,
-                    cert.x_500_issuer,
-                    cert.source,
-                    cert.isn,
-                    cert.updated_at,
-                ),
-            )
-        return len(certs)
+        return _copy_rows(cur, _ROOT_CA, certs)
 
     def _insert_dscs(
         self,
@@ -153,31 +238,11 @@ class PsycopgCertificateRepository:
         certs: list[CertificateRecord],
     ) -> int:
         """Insert DSC certificate records."""
-        for cert in certs:
-            cur.execute(
-                _INSERT_DSC,
-                (
-                    cert.id,
-                    cert.certificate,
-                    cert.subject_key_identifier,
-                    cert.authority_key_identifier,
-                    cert.issuer,
-                    cert.x_500_issuer,
-                    cert.source,
-                    cert.isn,
-                    cert.updated_at,
-                ),
-            )
-        return len(certs)
+        return _copy_rows(cur, _DSC, certs)
 
     def _insert_crls(self, cur: psycopg.Cursor[Any], crls: list[CrlRecord]) -> int:
         """Insert CRL records."""
-        for crl in crls:
-            cur.execute(
-                _INSERT_CRL,
-                (crl.id, crl.crl, crl.source, crl.issuer, crl.country, crl.updated_at),
-            )
-        return len(crls)
+        return _copy_rows(cur, _CRL, crls)
 
     def _insert_revoked(
         self,
@@ -185,18 +250,15 @@ class PsycopgCertificateRepository:
         revoked: list[RevokedCertificateRecord],
     ) -> int:
         """Insert revoked certificate records."""
-        for rec in revoked:
-            cur.execute(
-                _INSERT_REVOKED,
-                (
-                    rec.id,
-                    rec.source,
-                    rec.country,
-                    rec.isn,
-                    rec.crl,
-                    rec.revocation_reason,
-                    rec.revocation_date,
-                    rec.updated_at,
-                ),
-            )
-        return len(revoked)
+        return _copy_rows(cur, _REVOKED, revoked)
+
+
+def _copy_rows(cur: psycopg.Cursor[Any], target: _CopyTarget, records: Iterable[object]) -> int:
+    """Stream records through one binary COPY ... FROM STDIN and return how many were sent."""
+    count = 0
+    with cur.copy(target.statement) as copy:
+        copy.set_types(target.types)
+        for record in records:
+            copy.write_row(target.row(record))
+            count += 1
+    return count
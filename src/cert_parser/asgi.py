@@ -7,8 +7,10 @@ scheduler. Uvicorn serves this app with graceful shutdown (SIGTERM → drain + e
 Architecture:
   - FastAPI: lightweight web framework
   - Uvicorn: production ASGI server (handles signals, graceful shutdown)
-  - APScheduler: runs in background thread while Uvicorn listens for /health
-  - K8s Probes: liveness (checks scheduler thread alive) + readiness (after first run)
+  - APScheduler: AsyncIOScheduler on Uvicorn's event loop (no scheduler thread);
+    the sync pipeline job runs in the loop's default executor
+  - K8s Probes: liveness (checks scheduler running) + readiness (202 until the
+    startup sync has finished, then 200)
 
 Entry point for production: uvicorn cert_parser.asgi:app --host 0.0.0.0 --port 8000
 """
@@ -20,41 +22,92 @@ import os
 import threading
 from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
-from typing import Any
+from dataclasses import dataclass
+from typing import Annotated, Any
 
 import structlog
-from fastapi import FastAPI
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MISSED,
+    JobExecutionEvent,
+)
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from fastapi import Depends, FastAPI
 from fastapi.responses import JSONResponse
+from railway import ErrorCode
 from railway.result import Result
 
-from cert_parser.config import AppSettings
+from cert_parser.config import get_settings
 from cert_parser.main import _create_adapters, configure_structlog
 from cert_parser.pipeline import run_pipeline
-from cert_parser.scheduler import create_scheduler
+from cert_parser.scheduler import create_async_scheduler
 
 # ─────────────────────── Global State ───────────────────────
 # These are set during app startup and used for health checks.
 
-_scheduler_thread: threading.Thread | None = None
+_scheduler: AsyncIOScheduler | None = None
+_scheduler_started = False
+_scheduler_ready = False
 _error_message: str | None = None
 _pipeline_fn: Callable[[], Result[int]] | None = None
+# Held for the whole of any pipeline run, scheduled or manual, so the two never
+# overlap (each run replaces the full dataset). A plain threading.Lock because
+# runs execute on worker threads, not on the event loop.
+_pipeline_lock = threading.Lock()
+# How long shutdown waits for an in-flight run before closing its connections;
+# below Kubernetes' default 30 s termination grace period.
+_SHUTDOWN_GRACE_SECONDS = 25.0
 log = structlog.get_logger()
 
 
+def _exclusive(pipeline_fn: Callable[[], Result[int]]) -> Callable[[], Result[int]]:
+    """Wrap the pipeline so a scheduled run is skipped while another run holds the lock."""
+
+    def _run() -> Result[int]:
+        if not _pipeline_lock.acquire(blocking=False):
+            log.warning("pipeline.skipped", reason="another run in progress")
+            return Result.failure(ErrorCode.BUSINESS_RULE_ERROR, "Pipeline run already in progress")
+        try:
+            return pipeline_fn()
+        finally:
+            _pipeline_lock.release()
+
+    return _run
+
+
+def _on_startup_run_finished(event: JobExecutionEvent) -> None:
+    """
+    Mark the service ready once the startup sync is over, whatever the outcome.
+
+    A missed startup run counts too: otherwise /ready would report 202 forever
+    and the cron schedule takes over anyway.
+    """
+    global _scheduler_ready
+    if event.job_id == "cert_parser_startup":
+        _scheduler_ready = True
+        log.info(
+            "asgi.ready",
+            startup_run_failed=event.exception is not None,
+            startup_run_missed=event.code == EVENT_JOB_MISSED,
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     FastAPI lifespan context manager — runs on startup and shutdown.
 
-    Startup: Create adapters and start scheduler in background thread.
-    Shutdown: Gracefully stop scheduler and thread.
+    Startup: Create adapters and start the scheduler on the running event loop.
+    Shutdown: Stop the scheduler, wait for an in-flight run to finish, then
+    release HTTP and DB connections.
     """
-    global _scheduler_thread, _error_message
+    global _scheduler, _scheduler_started, _scheduler_ready, _error_message
 
     log.info("asgi.startup")
 
     try:
-        settings = AppSettings()
+        settings = get_settings()
     except Exception as e:
         error_msg = f"Configuration error: {e}"
         _error_message = error_msg
@@ -91,8 +144,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         global _pipeline_fn
         _pipeline_fn = pipeline_fn
 
-        scheduler = create_scheduler(
-            pipeline_fn=pipeline_fn,
+        scheduler = create_async_scheduler(
+            pipeline_fn=_exclusive(pipeline_fn),
             cron=settings.scheduler.cron,
             run_on_startup=settings.run_on_startup,
         )
@@ -102,24 +155,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         log.error("asgi.init_error", error=error_msg)
         raise
 
-    def run_scheduler() -> None:
-        """Run scheduler in background thread (blocking)."""
-        global _error_message
-        try:
-            log.info("asgi.scheduler_thread_started")
-            scheduler.start()
-        except KeyboardInterrupt:
-            log.info("asgi.scheduler_interrupted")
-        except Exception as e:
-            error_msg = f"Scheduler error: {e}"
-            _error_message = error_msg
-            log.error("asgi.scheduler_error", error=error_msg)
-
-    _scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-    _scheduler_thread.start()
-
-    # Brief pause to let the thread start before accepting readiness checks
-    await asyncio.sleep(0.5)
+    scheduler.add_listener(
+        _on_startup_run_finished, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED,
+    )
+    scheduler.start()
+    _scheduler = scheduler
+    _scheduler_started = True
+    _scheduler_ready = not settings.run_on_startup
+    log.info("asgi.scheduler_started")
 
     log.info("asgi.startup_complete")
 
@@ -128,22 +171,69 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # ──── Shutdown ────
     log.info("asgi.shutdown", reason="SIGTERM or server stop")
 
-    # Gracefully shutdown scheduler
+    # Stop scheduling new runs. AsyncIOScheduler cannot wait for a running job
+    # (its executor only cancels the futures), so wait=True would not help.
     try:
-        scheduler.shutdown(wait=True)
+        scheduler.shutdown(wait=False)
         log.info("asgi.scheduler_shutdown_complete")
     except Exception as e:
         log.warning("asgi.scheduler_shutdown_error", error=str(e))
 
-    # Wait for thread to finish (with timeout)
-    if _scheduler_thread and _scheduler_thread.is_alive():
-        _scheduler_thread.join(timeout=5.0)
-        if _scheduler_thread.is_alive():
-            log.warning("asgi.scheduler_thread_timeout", timeout_seconds=5.0)
+    # Drain: every run, scheduled or manual, holds the pipeline lock on its
+    # worker thread, so taking it means no run is still using the connections.
+    drained = await asyncio.to_thread(_pipeline_lock.acquire, timeout=_SHUTDOWN_GRACE_SECONDS)
+    if not drained:
+        log.warning("asgi.shutdown_grace_exceeded", grace_seconds=_SHUTDOWN_GRACE_SECONDS)
+
+    # Release pooled HTTP and database connections held by the adapters
+    try:
+        for adapter in (access_token_provider, sfc_token_provider, downloader, repository):
+            adapter.close()
+    finally:
+        if drained:
+            _pipeline_lock.release()
 
     log.info("asgi.shutdown_complete")
 
 
+# ─────────────────────── Route Dependencies ───────────────────────
+# Routes read the startup globals only through these, so tests can swap them
+# via app.dependency_overrides instead of writing module attributes.
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulerState:
+    """Snapshot of the startup/scheduler state reported by the probes."""
+
+    scheduler: AsyncIOScheduler | None
+    started: bool
+    ready: bool
+    error_message: str | None
+
+    @property
+    def running(self) -> bool:
+        return self.scheduler is not None and self.scheduler.running
+
+
+async def get_pipeline_fn() -> Callable[[], Result[int]] | None:
+    """The pipeline wired at startup, or None before the lifespan has run."""
+    return _pipeline_fn
+
+
+async def get_scheduler_state() -> SchedulerState:
+    """Current scheduler state, read at request time."""
+    return SchedulerState(
+        scheduler=_scheduler,
+        started=_scheduler_started,
+        ready=_scheduler_ready,
+        error_message=_error_message,
+    )
+
+
+PipelineFnDep = Annotated[Callable[[], Result[int]] | None, Depends(get_pipeline_fn)]
+SchedulerStateDep = Annotated[SchedulerState, Depends(get_scheduler_state)]
+
+
 # ─────────────────────── FastAPI Application ───────────────────────
 
 def _load_root_path() -> str:
@@ -167,26 +257,26 @@ app = FastAPI(
 
 
 @app.get("/health")
-async def health() -> JSONResponse:
+async def health(state: SchedulerStateDep) -> JSONResponse:
     """
     Kubernetes liveness probe — checks if the service is up.
 
     Returns 200 if:
-      - Scheduler thread is alive
+      - Scheduler is running
       - No fatal errors during startup
     Returns 503 if configuration failed or scheduler crashed.
     """
-    if _error_message:
-        log.warning("health.check_failed", error=_error_message)
+    if state.error_message:
+        log.warning("health.check_failed", error=state.error_message)
         return JSONResponse(
             status_code=503,
-            content={"status": "unhealthy", "error": _error_message},
+            content={"status": "unhealthy", "error": state.error_message},
         )
 
-    if not _scheduler_thread or not _scheduler_thread.is_alive():
+    if not state.running:
         return JSONResponse(
             status_code=503,
-            content={"status": "unhealthy", "reason": "scheduler thread not running"},
+            content={"status": "unhealthy", "reason": "scheduler not running"},
         )
 
     return JSONResponse(
@@ -196,26 +286,35 @@ async def health() -> JSONResponse:
 
 
 @app.get("/ready")
-async def ready() -> JSONResponse:
+async def ready(state: SchedulerStateDep) -> JSONResponse:
     """
     Kubernetes readiness probe — checks if the service is ready to handle requests.
 
-    Returns 200 when the scheduler thread is alive and no fatal startup error occurred.
-    Returns 503 if configuration failed or the scheduler thread has not started yet.
+    Returns 200 when the scheduler is running and the startup sync (if enabled)
+    has finished, whatever its outcome.
+    Returns 202 while the scheduler has not started or the startup sync is still
+    running.
+    Returns 503 if configuration failed or the scheduler has stopped.
 
-    Note: For a batch job, "ready" means the scheduler is running. It does NOT
-    require a successful pipeline run — the scheduler fires on its cron schedule.
+    Note: a failed startup sync still counts as ready — the scheduler retries on
+    its cron schedule, and /health reports whether the service is alive.
     """
-    if _error_message:
+    if state.error_message:
         return JSONResponse(
             status_code=503,
-            content={"status": "error", "error": _error_message},
+            content={"status": "error", "error": state.error_message},
+        )
+
+    if not state.started or not state.ready:
+        return JSONResponse(
+            status_code=202,
+            content={"status": "starting", "reason": "initial sync not finished"},
         )
 
-    if not _scheduler_thread or not _scheduler_thread.is_alive():
+    if not state.running:
         return JSONResponse(
             status_code=503,
-            content={"status": "starting", "reason": "scheduler thread not yet running"},
+            content={"status": "stopped", "reason": "scheduler not running"},
         )
 
     return JSONResponse(
@@ -225,7 +324,7 @@ async def ready() -> JSONResponse:
 
 
 @app.get("/info")
-async def info() -> dict[str, Any]:
+async def info(state: SchedulerStateDep) -> dict[str, Any]:
     """
     Info endpoint — returns application metadata.
 
@@ -234,13 +333,13 @@ async def info() -> dict[str, Any]:
     return {
         "name": "cert-parser",
         "version": "0.1.0",
-        "scheduler_running": _scheduler_thread is not None and _scheduler_thread.is_alive(),
-        "has_error": _error_message is not None,
+        "scheduler_running": state.running,
+        "has_error": state.error_message is not None,
     }
 
 
 @app.post("/trigger")
-async def trigger() -> JSONResponse:
+async def trigger(pipeline_fn: PipelineFnDep) -> JSONResponse:
     """
     Manually trigger the certificate parsing pipeline.
 
@@ -251,19 +350,30 @@ async def trigger() -> JSONResponse:
     blocking the ASGI event loop.
 
     Returns 200 with rows_stored on success.
+    Returns 409 if a scheduled or manual run is already in progress.
     Returns 500 with error details on pipeline failure.
     Returns 503 if the pipeline is not initialized yet.
     """
-    if _pipeline_fn is None:
+    if pipeline_fn is None:
         return JSONResponse(
             status_code=503,
             content={"status": "unavailable", "reason": "Pipeline not initialized"},
         )
 
-    log.info("trigger.manual_start", source="REST")
+    def _run_exclusive() -> Result[int] | None:
+        # Acquired and released on the worker thread: a request cancelled before
+        # the worker starts never holds the lock, and one cancelled mid-run can't
+        # free it while the run is still going.
+        if not _pipeline_lock.acquire(blocking=False):
+            return None
+        try:
+            log.info("trigger.manual_start", source="REST")
+            return pipeline_fn()
+        finally:
+            _pipeline_lock.release()
 
     try:
-        result = await asyncio.to_thread(_pipeline_fn)
+        result = await asyncio.to_thread(_run_exclusive)
     except Exception as e:
         log.error("trigger.exception", error=str(e))
         return JSONResponse(
@@ -271,6 +381,12 @@ async def trigger() -> JSONResponse:
             content={"status": "error", "error": str(e)},
         )
 
+    if result is None:
+        return JSONResponse(
+            status_code=409,
+            content={"status": "already_running", "reason": "A pipeline run is in progress"},
+        )
+
     if result.is_success():
         rows = result.value()
         log.info("trigger.completed", rows_stored=rows)
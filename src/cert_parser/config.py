@@ -17,8 +17,10 @@ var AUTH__URL maps to auth.url, DATABASE__HOST maps to database.host, etc.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
+from apscheduler.triggers.cron import CronTrigger
 from pydantic import BaseModel, Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -54,6 +56,11 @@ class LoginSettings(BaseModel):
     border_post_id: str = Field(description="Border post identifier")
     box_id: str = Field(description="Box identifier")
     passenger_control_type: str = Field(description="Passenger control type identifier")
+    token_ttl_seconds: int = Field(
+        default=0,
+        ge=0,
+        description="Reuse the SFC token for this many seconds (0 disables caching)",
+    )
 
 
 class DownloadSettings(BaseModel):
@@ -69,7 +76,7 @@ class DatabaseSettings(BaseModel):
     Accepts either a full connection string via DATABASE_DSN or individual
     components (DATABASE_HOST, DATABASE_PORT, DATABASE_NAME, DATABASE_USERNAME,
     DATABASE_PASSWORD). DATABASE_DSN takes priority when both are provided.
-    The DSN is always available via `dsn` after construction.
+    The effective DSN is always available via `get_dsn()` after construction.
     """
 
     # Option 1: full connection string (takes priority)
@@ -86,13 +93,12 @@ class DatabaseSettings(BaseModel):
     password: SecretStr | None = Field(default=None, description="PostgreSQL password")
 
     @model_validator(mode="after")
-    def resolve_dsn(self) -> DatabaseSettings:
+    def check_dsn_source(self) -> DatabaseSettings:
         """
-        Ensure `dsn` is always populated.
+        Require either DATABASE_DSN or every component needed to build one.
 
-        If DATABASE_DSN is not set, build the DSN from the individual
-        component fields. Raises ValueError at startup if neither a full DSN
-        nor all required components are provided.
+        Raises ValueError at startup if neither a full DSN nor all required
+        components are provided. The model itself is left untouched.
         """
         if self.dsn is not None:
             return self
@@ -107,22 +113,24 @@ class DatabaseSettings(BaseModel):
                 "Set DATABASE_DSN or provide all of: "
                 + ", ".join(missing)
             )
-        dsn_value = (
-            f"postgresql://{self.username}:{self.password.get_secret_value()}"  # type: ignore[union-attr]
-            f"@{self.host}:{self.port}/{self.name}"
-        )
-        object.__setattr__(self, "dsn", SecretStr(dsn_value))
         return self
 
     def get_dsn(self) -> str:
         """
         Return the active database DSN as a plain string.
 
-        Always safe to call after construction — `resolve_dsn` guarantees
-        `dsn` is populated whether it came from DATABASE_DSN or components.
+        Always safe to call after construction — `check_dsn_source` guarantees
+        either DATABASE_DSN is set or every component is present.
         """
-        assert self.dsn is not None  # guaranteed by resolve_dsn validator
-        return self.dsn.get_secret_value()
+        if self.dsn is not None:
+            return self.dsn.get_secret_value()
+        if self.password is None:
+            # Unreachable after check_dsn_source; explicit so it survives python -O.
+            raise RuntimeError("Database DSN unresolved: check_dsn_source did not run")
+        return (
+            f"postgresql://{self.username}:{self.password.get_secret_value()}"
+            f"@{self.host}:{self.port}/{self.name}"
+        )
 
 
 class SchedulerSettings(BaseModel):
@@ -145,13 +153,17 @@ class SchedulerSettings(BaseModel):
     @field_validator("cron")
     @classmethod
     def validate_cron(cls, value: str) -> str:
-        """Reject expressions that don't have exactly 5 space-separated fields."""
+        """Reject expressions that aren't 5 fields or that APScheduler can't parse."""
         fields = value.strip().split()
         if len(fields) != 5:
             raise ValueError(
                 f"Cron expression must have exactly 5 fields "
                 f"(minute hour dom month dow), got {len(fields)}: {value!r}"
             )
+        try:
+            CronTrigger.from_crontab(value)
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression {value!r}: {e}") from e
         return value.strip()
 
 
@@ -192,3 +204,15 @@ class AppSettings(BaseSettings):
             "Leave empty when running without a gateway."
         ),
     )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """
+    Load and validate AppSettings once per process.
+
+    Entry points call this instead of AppSettings() so the env + .env scan runs
+    once. Validation errors are not cached — the next call retries.
+    Tests that change the environment call get_settings.cache_clear().
+    """
+    return AppSettings()
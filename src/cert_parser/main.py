@@ -20,37 +20,50 @@ from __future__ import annotations
 import logging
 import sys
 from functools import partial
+from typing import TYPE_CHECKING
 
 import structlog
 
-from cert_parser.adapters.cms_parser import CmsMasterListParser
-from cert_parser.adapters.http_client import (
-    HttpAccessTokenProvider,
-    HttpBinaryDownloader,
-    HttpSfcTokenProvider,
-)
-from cert_parser.adapters.repository import PsycopgCertificateRepository
-from cert_parser.config import AppSettings
+from cert_parser.config import AppSettings, get_settings
 from cert_parser.pipeline import run_pipeline
 from cert_parser.scheduler import create_scheduler
 
+# Adapter modules pull in httpx, cryptography, asn1crypto and psycopg. They are
+# imported inside _create_adapters() so a misconfigured container fails on
+# settings validation without paying that import cost first.
+if TYPE_CHECKING:
+    from cert_parser.adapters.cms_parser import CmsMasterListParser
+    from cert_parser.adapters.http_client import (
+        HttpAccessTokenProvider,
+        HttpBinaryDownloader,
+        HttpSfcTokenProvider,
+    )
+    from cert_parser.adapters.repository import PsycopgCertificateRepository
+
 
 def configure_structlog(log_level: str = "INFO") -> None:
     """
     Configure structlog for structured, JSON-formatted logging.
 
-    In production: JSON lines to stdout (machine-readable).
-    In development: colored, human-readable console output.
+    In production (stdout not a TTY, e.g. a K8s pod): JSON lines, one per event.
+    In development (interactive terminal): colored, human-readable console output.
     """
+    interactive = sys.stdout.isatty()
+    processors: list[structlog.types.Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.StackInfoRenderer(),
+        structlog.dev.set_exc_info,
+        structlog.processors.TimeStamper(fmt="iso"),
+    ]
+    if interactive:
+        processors.append(structlog.dev.ConsoleRenderer())
+    else:
+        processors.append(structlog.processors.format_exc_info)
+        processors.append(structlog.processors.JSONRenderer())
+
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(),
-        ],
+        processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(
             getattr(logging, log_level.upper(), logging.INFO)
         ),
@@ -60,6 +73,9 @@ def configure_structlog(log_level: str = "INFO") -> None:
     )
 
 
+_DB_POOL_MAX_SIZE = 4
+_DB_POOL_WAIT_SECONDS = 5.0
+
 type _Adapters = tuple[
     HttpAccessTokenProvider,
     HttpSfcTokenProvider,
@@ -76,37 +92,67 @@ def _create_adapters(settings: AppSettings) -> _Adapters:
     This is the ONLY place where concrete classes are created.
     Creates 5 adapters: access token provider, SFC token provider,
     binary downloader, CMS parser, and PostgreSQL repository.
+    The three HTTP adapters share one pooled httpx client.
+
+    The repository's connection pool is opened here and waits for its first
+    connection, so an unreachable database or a bad DSN fails at startup
+    (psycopg_pool.PoolTimeout) instead of on the first scheduled run.
     """
+    from psycopg_pool import ConnectionPool
+
+    from cert_parser.adapters.cms_parser import CmsMasterListParser
+    from cert_parser.adapters.http_client import (
+        HttpAccessTokenProvider,
+        HttpBinaryDownloader,
+        HttpSfcTokenProvider,
+        create_http_client,
+    )
+    from cert_parser.adapters.repository import PsycopgCertificateRepository
+
+    http_client = create_http_client(settings.http_timeout_seconds)
     access_token_provider = HttpAccessTokenProvider(
         auth_url=settings.auth.url,
         client_id=settings.auth.client_id,
         client_secret=settings.auth.client_secret.get_secret_value(),
         username=settings.auth.username,
         password=settings.auth.password.get_secret_value(),
-        timeout=settings.http_timeout_seconds,
+        client=http_client,
     )
     sfc_token_provider = HttpSfcTokenProvider(
         login_url=settings.login.url,
         border_post_id=settings.login.border_post_id,
         box_id=settings.login.box_id,
         passenger_control_type=settings.login.passenger_control_type,
-        timeout=settings.http_timeout_seconds,
+        token_ttl_seconds=settings.login.token_ttl_seconds,
+        client=http_client,
     )
     downloader = HttpBinaryDownloader(
         download_url=settings.download.url,
-        timeout=settings.http_timeout_seconds,
+        client=http_client,
     )
     parser = CmsMasterListParser()
-    repository = PsycopgCertificateRepository(
-        dsn=settings.database.get_dsn(),
+    dsn = settings.database.get_dsn()
+    pool = ConnectionPool(
+        conninfo=dsn,
+        min_size=1,
+        max_size=_DB_POOL_MAX_SIZE,
+        check=ConnectionPool.check_connection,  # the idle connection may outlive the server's
+        open=True,
     )
+    try:
+        pool.wait(timeout=_DB_POOL_WAIT_SECONDS)
+    except Exception:
+        pool.close()
+        http_client.close()
+        raise
+    repository = PsycopgCertificateRepository(dsn=dsn, pool=pool)
     return access_token_provider, sfc_token_provider, downloader, parser, repository
 
 
 def main() -> None:
     """Wire dependencies and launch the scheduled pipeline."""
     try:
-        settings = AppSettings()
+        settings = get_settings()
     except Exception as e:
         print(f"FATAL: Configuration error — {e}", file=sys.stderr)  # noqa: T201
         sys.exit(1)
@@ -122,9 +168,13 @@ def main() -> None:
         run_on_startup=settings.run_on_startup,
     )
 
-    access_token_provider, sfc_token_provider, downloader, parser, repository = (
-        _create_adapters(settings)
-    )
+    try:
+        access_token_provider, sfc_token_provider, downloader, parser, repository = (
+            _create_adapters(settings)
+        )
+    except Exception as e:
+        log.error("app.fatal_error", error=str(e))
+        sys.exit(1)
 
     pipeline_fn = partial(
         run_pipeline,
@@ -153,6 +203,9 @@ def main() -> None:
     except Exception as e:
         log.error("app.fatal_error", error=str(e))
         sys.exit(1)
+    finally:
+        for adapter in (access_token_provider, sfc_token_provider, downloader, repository):
+            adapter.close()
 
 
 if __name__ == "__main__":
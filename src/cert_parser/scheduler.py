@@ -7,7 +7,12 @@ scheduling driven by a standard 5-field cron expression.
 The scheduler wraps pipeline execution within a LoggingExecutionContext
 for structured observability (timing, success/failure logging).
 
-Graceful shutdown: handles SIGINT/SIGTERM to stop the scheduler cleanly.
+Two flavours share the same job and trigger:
+  - create_scheduler(): BlockingScheduler for the CLI entry point; handles
+    SIGINT/SIGTERM itself to stop cleanly.
+  - create_async_scheduler(): AsyncIOScheduler for the ASGI app; runs on
+    Uvicorn's event loop (no extra scheduler thread) and leaves signal
+    handling to Uvicorn. The sync pipeline job runs in the loop's executor.
 """
 
 from __future__ import annotations
@@ -17,8 +22,11 @@ import sys
 from collections.abc import Callable
 
 import structlog
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import BaseScheduler
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from railway import LoggingExecutionContext
 from railway.result import Result
 
@@ -37,12 +45,50 @@ def create_scheduler(
         pipeline_fn: Zero-argument callable returning Result[int] (the wired pipeline).
         cron: Standard 5-field cron expression (minute hour dom month dow).
               Default "0 */6 * * *" runs every 6 hours.
-        run_on_startup: If True, execute once immediately before entering the loop.
+        run_on_startup: If True, queue a one-off run that fires as soon as the
+              scheduler starts.
 
     Returns:
         A configured BlockingScheduler (call .start() to begin).
     """
     scheduler = BlockingScheduler()
+    _register_shutdown_signals(scheduler)
+
+    job = _make_job(pipeline_fn)
+    _add_cron_job(scheduler, job, cron)
+
+    if run_on_startup:
+        _add_startup_job(scheduler, job)
+
+    return scheduler
+
+
+def create_async_scheduler(
+    pipeline_fn: Callable[[], Result[int]],
+    cron: str = "0 */6 * * *",
+    run_on_startup: bool = True,
+) -> AsyncIOScheduler:
+    """
+    Create an AsyncIOScheduler that runs the pipeline on a cron schedule.
+
+    Same jobs and trigger as create_scheduler(), but meant to be started from
+    inside a running event loop (the ASGI lifespan).
+
+    Returns:
+        A configured AsyncIOScheduler (call .start() from the running loop).
+    """
+    scheduler = AsyncIOScheduler()
+    job = _make_job(pipeline_fn)
+    _add_cron_job(scheduler, job, cron)
+
+    if run_on_startup:
+        _add_startup_job(scheduler, job)
+
+    return scheduler
+
+
+def _make_job(pipeline_fn: Callable[[], Result[int]]) -> Callable[[], None]:
+    """Wrap the pipeline in a LoggingExecutionContext and log the outcome."""
     ctx = LoggingExecutionContext(operation="MasterListSync")
 
     def _job() -> None:
@@ -53,28 +99,38 @@ def create_scheduler(
         else:
             log.error("scheduler.job_failed", failure=str(result.error()))
 
-    minute, hour, dom, month, dow = cron.split()
+    return _job
+
+
+def _add_cron_job(scheduler: BaseScheduler, job: Callable[[], None], cron: str) -> None:
+    """Register the sync job on a CronTrigger built from a 5-field expression."""
     scheduler.add_job(
-        _job,
-        trigger=CronTrigger(
-            minute=minute,
-            hour=hour,
-            day=dom,
-            month=month,
-            day_of_week=dow,
-        ),
+        job,
+        trigger=CronTrigger.from_crontab(cron),
         id="cert_parser_sync",
         name="ICAO Master List sync",
         replace_existing=True,
     )
 
-    if run_on_startup:
-        log.info("scheduler.startup_run", message="Running pipeline immediately on startup")
-        _job()
 
-    _register_shutdown_signals(scheduler)
+def _add_startup_job(scheduler: BaseScheduler, job: Callable[[], None]) -> None:
+    """
+    Queue a one-off run that fires on the scheduler's first tick after start().
 
-    return scheduler
+    Nothing runs inline, so startup never blocks on the pipeline and a startup
+    failure goes through the same logging path as every scheduled run.
+    No misfire grace limit: a loop that starts late still runs the job instead
+    of dropping it as missed (APScheduler's default grace is 1 s).
+    """
+    log.info("scheduler.startup_run", message="Queueing pipeline run on startup")
+    scheduler.add_job(
+        job,
+        trigger=DateTrigger(),  # run_date defaults to now
+        id="cert_parser_startup",
+        name="ICAO Master List startup sync",
+        misfire_grace_time=None,
+        coalesce=True,
+    )
 
 
 def _register_shutdown_signals(scheduler: BlockingScheduler) -> None:
@@ -2,21 +2,40 @@
 Acceptance test fixtures — PostgreSQL testcontainer for end-to-end tests.
 
 Reuses the same DDL and pattern as integration tests but scoped for acceptance.
+As there, Docker/psycopg imports happen inside the fixtures that need them.
 """
 
 from __future__ import annotations
 
-import psycopg
+from typing import TYPE_CHECKING
+
 import pytest
-from testcontainers.postgres import PostgresContainer
 
-from tests.integration.conftest import DDL, TRUNCATE_ALL
+from tests.integration.conftest import (
+    DDL,
+    POSTGRES_FAST_FLAGS,
+    POSTGRES_IMAGE,
+    TRUNCATE_ALL,
+    docker_available,
+)
+
+if TYPE_CHECKING:
+    from testcontainers.postgres import PostgresContainer
+
+    from cert_parser.adapters.cms_parser import CmsMasterListParser
+    from cert_parser.adapters.repository import PsycopgCertificateRepository
 
 
 @pytest.fixture(scope="session")
 def acceptance_pg() -> PostgresContainer:
     """Start a PostgreSQL container for the acceptance test session."""
-    with PostgresContainer("postgres:16-alpine") as pg:
+    if not docker_available():
+        pytest.skip("Docker daemon unavailable")
+
+    import psycopg
+    from testcontainers.postgres import PostgresContainer
+
+    with PostgresContainer(POSTGRES_IMAGE).with_command(POSTGRES_FAST_FLAGS) as pg:
         dsn = pg.get_connection_url().replace("postgresql+psycopg2", "postgresql")
         with psycopg.connect(dsn) as conn:
             conn.execute(DDL)
@@ -27,8 +46,26 @@ def acceptance_pg() -> PostgresContainer:
 @pytest.fixture()
 def acceptance_dsn(acceptance_pg: PostgresContainer) -> str:
     """Return a psycopg-compatible DSN and truncate all tables before each test."""
+    import psycopg
+
     connection_url = acceptance_pg.get_connection_url().replace("postgresql+psycopg2", "postgresql")
     with psycopg.connect(connection_url) as conn:
         conn.execute(TRUNCATE_ALL)
         conn.commit()
     return connection_url
+
+
+@pytest.fixture(scope="session")
+def cms_parser() -> CmsMasterListParser:
+    """One parser for the whole session — it holds no state between parse() calls."""
+    from cert_parser.adapters.cms_parser import CmsMasterListParser
+
+    return CmsMasterListParser()
+
+
+@pytest.fixture()
+def repo(acceptance_dsn: str) -> PsycopgCertificateRepository:
+    """Repository bound to the freshly truncated acceptance database."""
+    from cert_parser.adapters.repository import PsycopgCertificateRepository
+
+    return PsycopgCertificateRepository(acceptance_dsn)
@@ -7,13 +7,17 @@ Uses real ICAO Master List fixture files and a testcontainers PostgreSQL instanc
 Each test follows Given/When/Then BDD structure in its docstring.
 
 Markers: @pytest.mark.acceptance — requires Docker + PostgreSQL + ICAO fixtures.
+
+Every test replaces the whole dataset, so they cannot share tables concurrently.
+Under pytest-xdist (-n auto --dist loadgroup) the xdist_group mark keeps them
+on one worker and one container, while the rest of the suite fans out.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
-import psycopg
 import pytest
 from railway.assertions import ResultAssertions
 from railway.result import Result
@@ -22,9 +26,10 @@ from cert_parser.adapters.cms_parser import CmsMasterListParser
 from cert_parser.adapters.repository import PsycopgCertificateRepository
 from cert_parser.domain.models import AuthCredentials
 from cert_parser.pipeline import run_pipeline
-from tests.conftest import fixture_path
+from tests.conftest import load_fixture_bytes
+from tests.integration.conftest import connect_local
 
-pytestmark = pytest.mark.acceptance
+pytestmark = [pytest.mark.acceptance, pytest.mark.xdist_group("acceptance_pg")]
 
 
 # ── Fake adapters (mock HTTP layer) ──────────────────────────────────────────
@@ -60,161 +65,138 @@ class FakeBinaryDownloader:
         return Result.success(self.data)
 
 
+# The token fakes are stateless and identical in every test — share one of each.
+FAKE_ACCESS = FakeAccessTokenProvider()
+FAKE_SFC = FakeSfcTokenProvider()
+
+
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
-def _count_rows(dsn: str, table: str) -> int:
-    with psycopg.connect(dsn) as conn:
-        row = conn.execute(f"SELECT count(*) FROM {table}").fetchone()  # noqa: S608
-        return row[0] if row else 0
+_TABLES = ("root_ca", "dsc", "crls", "revoked_certificate_list")
+_COUNT_ALL = "SELECT " + ", ".join(f"(SELECT count(*) FROM certs.{t})" for t in _TABLES)  # noqa: S608
 
 
-# ── Acceptance Tests ─────────────────────────────────────────────────────────
+def _count_all(dsn: str) -> dict[str, int]:
+    """Row counts for all four tables — one connection, one round-trip."""
+    with connect_local(dsn) as conn:
+        row = conn.execute(_COUNT_ALL).fetchone()
+        assert row is not None
+        return dict(zip(_TABLES, row, strict=True))
 
 
-class TestFullPipelineSeychelles:
-    """End-to-end: Seychelles ML file → parse → store → verify DB."""
+type RunAndCount = Callable[[bytes], tuple[Result[int], dict[str, int]]]
 
-    def test_pipeline_stores_seychelles_certificates(self, acceptance_dsn: str) -> None:
-        """
-        GIVEN a valid Seychelles Master List CMS blob (ml_sc.bin)
-        AND a real CMS parser and a real PostgreSQL repository
-        WHEN the pipeline runs end-to-end (mock HTTP → parse → store)
-        THEN the result is Success with rows stored > 0
-        AND the root_ca table contains at least 1 certificate
-        AND all four tables are populated or correctly empty.
-        """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
 
+@pytest.fixture()
+def run_and_count(
+    acceptance_dsn: str,
+    cms_parser: CmsMasterListParser,
+    repo: PsycopgCertificateRepository,
+) -> RunAndCount:
+    """
+    Run the pipeline on a downloaded blob, then read back all table counts.
+
+    Wires the fake HTTP adapters with the real parser and repository, so each
+    test states only its input bytes and its expectations.
+    """
+
+    def _run(data: bytes) -> tuple[Result[int], dict[str, int]]:
         result = run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=raw_bin),
-            parser=CmsMasterListParser(),
-            repository=PsycopgCertificateRepository(acceptance_dsn),
+            access_token_provider=FAKE_ACCESS,
+            sfc_token_provider=FAKE_SFC,
+            downloader=FakeBinaryDownloader(data=data),
+            parser=cms_parser,
+            repository=repo,
         )
+        return result, _count_all(acceptance_dsn)
 
-        count = ResultAssertions.assert_success(result)
-        assert count > 0
-        assert _count_rows(acceptance_dsn, "root_ca") >= 1
+    return _run
+
+
+@pytest.fixture()
+def seeded_with_seychelles(run_and_count: RunAndCount) -> dict[str, int]:
+    """Store ml_sc.bin as the prior dataset and return the resulting table counts."""
+    result, counts = run_and_count(load_fixture_bytes("ml_sc.bin"))
+    ResultAssertions.assert_success(result)
+    assert counts["root_ca"] >= 1
+    return counts
 
 
-class TestFullPipelineFrance:
-    """End-to-end: France ML file → parse → store → verify DB."""
+# ── Acceptance Tests ─────────────────────────────────────────────────────────
+
 
-    def test_pipeline_stores_france_certificates(self, acceptance_dsn: str) -> None:
+class TestFullPipelinePerCountry:
+    """End-to-end: single-country ML file → parse → store → verify DB."""
+
+    @pytest.mark.parametrize(
+        ("fixture_name", "min_root_cas"),
+        [
+            ("ml_sc.bin", 1),  # Seychelles
+            ("ml_fr.bin", 6),  # France has many certificates
+            ("ml_bd.bin", 1),  # Bangladesh
+        ],
+    )
+    def test_pipeline_stores_country_certificates(
+        self, run_and_count: RunAndCount, fixture_name: str, min_root_cas: int
+    ) -> None:
         """
-        GIVEN a valid France Master List CMS blob (ml_fr.bin)
-        WHEN the pipeline runs end-to-end
-        THEN multiple root CA certificates are stored (France has many)
-        AND the result row count matches total items in the DB.
+        GIVEN a valid single-country Master List CMS blob
+        AND a real CMS parser and a real PostgreSQL repository
+        WHEN the pipeline runs end-to-end (mock HTTP → parse → store)
+        THEN the result is Success and its row count matches total items in the DB
+        AND the root_ca table holds at least the expected number of certificates.
         """
-        raw_bin = fixture_path("ml_fr.bin").read_bytes()
-
-        result = run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=raw_bin),
-            parser=CmsMasterListParser(),
-            repository=PsycopgCertificateRepository(acceptance_dsn),
-        )
+        result, counts = run_and_count(load_fixture_bytes(fixture_name))
 
         count = ResultAssertions.assert_success(result)
-        db_root_cas = _count_rows(acceptance_dsn, "root_ca")
-        db_crls = _count_rows(acceptance_dsn, "crls")
-        assert count == db_root_cas + db_crls + _count_rows(acceptance_dsn, "dsc") + _count_rows(
-            acceptance_dsn, "revoked_certificate_list"
-        )
-        assert db_root_cas > 5  # France ML has many certificates
+        assert count == sum(counts.values())
+        assert counts["root_ca"] >= min_root_cas
 
 
 class TestTransactionalReplaceEndToEnd:
     """End-to-end: verify second run replaces first run's data atomically."""
 
-    def test_second_pipeline_run_replaces_first(self, acceptance_dsn: str) -> None:
+    def test_second_pipeline_run_replaces_first(
+        self, seeded_with_seychelles: dict[str, int], run_and_count: RunAndCount
+    ) -> None:
         """
         GIVEN the pipeline has already run with Seychelles data
         WHEN the pipeline runs again with Bangladesh data
         THEN only Bangladesh data remains in the database
         AND no Seychelles certificates remain.
         """
-        sc_bin = fixture_path("ml_sc.bin").read_bytes()
-        bd_bin = fixture_path("ml_bd.bin").read_bytes()
-        parser = CmsMasterListParser()
-        repo = PsycopgCertificateRepository(acceptance_dsn)
-
-        # First run — Seychelles
-        run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=sc_bin),
-            parser=parser,
-            repository=repo,
-        )
-        sc_count = _count_rows(acceptance_dsn, "root_ca")
-        assert sc_count >= 1
-
-        # Second run — Bangladesh
-        result = run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=bd_bin),
-            parser=parser,
-            repository=repo,
-        )
+        result, counts = run_and_count(load_fixture_bytes("ml_bd.bin"))
 
         count = ResultAssertions.assert_success(result)
-        bd_count = _count_rows(acceptance_dsn, "root_ca")
-        assert bd_count >= 1
         assert count > 0
-
-        assert bd_count > 0
+        assert counts["root_ca"] >= 1
 
 
 class TestPipelineWithCorruptData:
     """End-to-end: verify pipeline failure propagation to result."""
 
-    def test_corrupt_bin_does_not_corrupt_database(self, acceptance_dsn: str) -> None:
+    def test_corrupt_bin_does_not_corrupt_database(
+        self, seeded_with_seychelles: dict[str, int], run_and_count: RunAndCount
+    ) -> None:
         """
         GIVEN the database contains valid Seychelles data from a prior run
         WHEN the pipeline runs with corrupt binary data
         THEN the pipeline returns a Failure result
         AND the database still contains the Seychelles data (old data preserved).
         """
-        sc_bin = fixture_path("ml_sc.bin").read_bytes()
-        parser = CmsMasterListParser()
-        repo = PsycopgCertificateRepository(acceptance_dsn)
-
-        # First run — load valid data
-        run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=sc_bin),
-            parser=parser,
-            repository=repo,
-        )
-        original_count = _count_rows(acceptance_dsn, "root_ca")
-        assert original_count >= 1
-
-        # Second run — corrupt data (parser fails before store)
-        result = run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=b"not-valid-cms-data"),
-            parser=parser,
-            repository=repo,
-        )
+        result, counts = run_and_count(b"not-valid-cms-data")
 
         # Pipeline failed at parse stage — store never called
         ResultAssertions.assert_failure(result)
         # Old data preserved (parser failed before repository.store was reached)
-        assert _count_rows(acceptance_dsn, "root_ca") == original_count
+        assert counts == seeded_with_seychelles
 
 
 class TestFullPipelineComposite:
     """End-to-end: Composite ML (3 countries + CRL) → parse → store → verify DB."""
 
-    def test_pipeline_stores_all_data_types(self, acceptance_dsn: str) -> None:
+    def test_pipeline_stores_all_data_types(self, run_and_count: RunAndCount) -> None:
         """
         GIVEN ml_composite.bin containing 8 root CAs, 1 CRL, and 15 revoked entries
         AND a real CMS parser and a real PostgreSQL repository
@@ -222,78 +204,47 @@ class TestFullPipelineComposite:
         THEN root_ca, crls, and revoked_certificate_list tables are all populated
         AND the total stored count matches 8 + 1 + 15 = 24.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-
-        result = run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=raw_bin),
-            parser=CmsMasterListParser(),
-            repository=PsycopgCertificateRepository(acceptance_dsn),
-        )
+        result, counts = run_and_count(load_fixture_bytes("ml_composite.bin"))
 
         count = ResultAssertions.assert_success(result)
         assert count == 24
-        assert _count_rows(acceptance_dsn, "root_ca") == 8
-        assert _count_rows(acceptance_dsn, "crls") == 1
-        assert _count_rows(acceptance_dsn, "revoked_certificate_list") == 15
+        assert counts["root_ca"] == 8
+        assert counts["crls"] == 1
+        assert counts["revoked_certificate_list"] == 15
 
-    def test_crl_foreign_key_references_are_valid(self, acceptance_dsn: str) -> None:
+    def test_crl_foreign_key_references_are_valid(
+        self, acceptance_dsn: str, run_and_count: RunAndCount
+    ) -> None:
         """
         GIVEN ml_composite.bin stored in the database
         WHEN querying revoked_certificate_list
         THEN every revoked entry's crl UUID references an existing crls row.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-
-        run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=raw_bin),
-            parser=CmsMasterListParser(),
-            repository=PsycopgCertificateRepository(acceptance_dsn),
-        )
-
-        with psycopg.connect(acceptance_dsn) as conn:
-            # All revoked entries must reference a valid CRL
-            orphans = conn.execute(
-                "SELECT r.id FROM revoked_certificate_list r "
-                "LEFT JOIN crls c ON r.crl = c.id "
-                "WHERE c.id IS NULL"
-            ).fetchall()
-            assert len(orphans) == 0, f"Found {len(orphans)} orphan revoked entries"
-
-    def test_transactional_replace_clears_all_tables(self, acceptance_dsn: str) -> None:
+        run_and_count(load_fixture_bytes("ml_composite.bin"))
+
+        with connect_local(acceptance_dsn) as conn:
+            # All revoked entries must reference a valid CRL — stop at the first orphan
+            orphan = conn.execute(
+                "SELECT r.id FROM certs.revoked_certificate_list r "
+                "WHERE NOT EXISTS (SELECT 1 FROM certs.crls c WHERE c.id = r.crl) "
+                "LIMIT 1"
+            ).fetchone()
+            assert orphan is None, f"Orphan revoked entry: {orphan[0]}"
+
+    def test_transactional_replace_clears_all_tables(self, run_and_count: RunAndCount) -> None:
         """
         GIVEN the database has composite data (root CAs + CRLs + revoked)
         WHEN the pipeline runs again with Seychelles-only data (no CRLs)
         THEN CRLs and revoked entries are deleted (transactional replace)
         AND only Seychelles root CAs remain.
         """
-        composite_bin = fixture_path("ml_composite.bin").read_bytes()
-        sc_bin = fixture_path("ml_sc.bin").read_bytes()
-        parser = CmsMasterListParser()
-        repo = PsycopgCertificateRepository(acceptance_dsn)
-
         # First run — composite (CRLs + revoked)
-        run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=composite_bin),
-            parser=parser,
-            repository=repo,
-        )
-        assert _count_rows(acceptance_dsn, "crls") == 1
-        assert _count_rows(acceptance_dsn, "revoked_certificate_list") == 15
+        _, counts = run_and_count(load_fixture_bytes("ml_composite.bin"))
+        assert counts["crls"] == 1
+        assert counts["revoked_certificate_list"] == 15
 
         # Second run — Seychelles only (no CRLs)
-        run_pipeline(
-            access_token_provider=FakeAccessTokenProvider(),
-            sfc_token_provider=FakeSfcTokenProvider(),
-            downloader=FakeBinaryDownloader(data=sc_bin),
-            parser=parser,
-            repository=repo,
-        )
-        assert _count_rows(acceptance_dsn, "crls") == 0
-        assert _count_rows(acceptance_dsn, "revoked_certificate_list") == 0
-        assert _count_rows(acceptance_dsn, "root_ca") >= 1
+        _, counts = run_and_count(load_fixture_bytes("ml_sc.bin"))
+        assert counts["crls"] == 0
+        assert counts["revoked_certificate_list"] == 0
+        assert counts["root_ca"] >= 1
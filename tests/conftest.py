@@ -7,6 +7,7 @@ extracted from the ICAO PKD LDIF data.
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
 import pytest
@@ -30,3 +31,14 @@ def fixture_path(filename: str) -> Path:
     if not path.exists():
         raise FileNotFoundError(f"Test fixture not found: {path}")
     return path
+
+
+@cache
+def load_fixture_bytes(filename: str) -> bytes:
+    """
+    Read a test fixture file once per process and return its bytes.
+
+    Safe to share across tests: bytes are immutable, and nothing downstream
+    of the downloader writes to the blob.
+    """
+    return fixture_path(filename).read_bytes()
@@ -2,18 +2,31 @@
 Integration test fixtures — PostgreSQL testcontainer and schema setup.
 
 Provides a real PostgreSQL instance for each test session via testcontainers.
-Creates all four tables matching the production schema.
+Creates all four tables in the certs schema, matching the production
+migration db_migrations/V1_0_0__certs.sql (UNLOGGED — the
+container is disposable, so there is no WAL to write).
 Each test gets a fresh, clean database via truncation.
+
+psycopg and testcontainers (which pulls in the Docker SDK) are imported inside
+the fixtures and helpers that need them, so collecting or running the
+respx-only tests in this directory doesn't load either.
 """
 
 from __future__ import annotations
 
-import psycopg
+from functools import cache
+from typing import TYPE_CHECKING
+
 import pytest
-from testcontainers.postgres import PostgresContainer
+
+if TYPE_CHECKING:
+    import psycopg
+    from testcontainers.postgres import PostgresContainer
 
 DDL = """
-CREATE TABLE root_ca (
+CREATE SCHEMA certs;
+
+CREATE UNLOGGED TABLE certs.root_ca (
     id                        UUID PRIMARY KEY,
     certificate               BYTEA NOT NULL,
     subject_key_identifier    TEXT,
@@ -26,7 +39,7 @@ CREATE TABLE root_ca (
     updated_at                TIMESTAMP WITHOUT TIME ZONE
 );
 
-CREATE TABLE dsc (
+CREATE UNLOGGED TABLE certs.dsc (
     id                        UUID PRIMARY KEY,
     certificate               BYTEA NOT NULL,
     subject_key_identifier    TEXT,
@@ -38,7 +51,7 @@ CREATE TABLE dsc (
     updated_at                TIMESTAMP WITHOUT TIME ZONE
 );
 
-CREATE TABLE crls (
+CREATE UNLOGGED TABLE certs.crls (
     id          UUID PRIMARY KEY,
     crl         BYTEA NOT NULL,
     source      TEXT,
@@ -47,41 +60,109 @@ CREATE TABLE crls (
     updated_at  TIMESTAMP WITHOUT TIME ZONE
 );
 
-CREATE TABLE revoked_certificate_list (
+CREATE UNLOGGED TABLE certs.revoked_certificate_list (
     id                UUID PRIMARY KEY,
     source            TEXT,
     country           TEXT,
     isn               TEXT,
-    crl               UUID REFERENCES crls(id),
+    crl               UUID REFERENCES certs.crls(id),
     revocation_reason TEXT,
     revocation_date   TIMESTAMP WITHOUT TIME ZONE,
     updated_at        TIMESTAMP WITHOUT TIME ZONE
 );
 """
 
+# The container is thrown away after the session, so durability buys nothing:
+# skip fsync and WAL so bulk inserts in the store tests aren't disk-bound.
+POSTGRES_IMAGE = "postgres:16-alpine"
+POSTGRES_FAST_FLAGS = (
+    "-c fsync=off -c synchronous_commit=off -c full_page_writes=off "
+    "-c wal_level=minimal -c max_wal_senders=0"
+)
+
 TRUNCATE_ALL = """
-TRUNCATE revoked_certificate_list, crls, dsc, root_ca CASCADE;
+TRUNCATE certs.revoked_certificate_list, certs.crls, certs.dsc, certs.root_ca CASCADE;
 """
 
 
+@cache
+def docker_available() -> bool:
+    """
+    Ping the Docker daemon once per session.
+
+    Lets the container fixtures skip cleanly on a machine without Docker instead
+    of erroring after testcontainers' own connection attempts time out.
+    """
+    try:
+        import docker
+
+        docker.from_env(timeout=2).ping()
+    except Exception:
+        return False
+    return True
+
+
 @pytest.fixture(scope="session")
 def postgres_container() -> PostgresContainer:
     """Start a PostgreSQL container for the entire test session."""
-    with PostgresContainer("postgres:16-alpine") as pg:
-        dsn = pg.get_connection_url().replace("postgresql+psycopg2", "postgresql")
-        with psycopg.connect(dsn) as conn:
+    if not docker_available():
+        pytest.skip("Docker daemon unavailable")
+
+    import psycopg
+    from testcontainers.postgres import PostgresContainer
+
+    with PostgresContainer(POSTGRES_IMAGE).with_command(POSTGRES_FAST_FLAGS) as pg:
+        with psycopg.connect(_connection_url(pg)) as conn:
             conn.execute(DDL)
             conn.commit()
         yield pg
 
 
+def connect_local(url: str, *, autocommit: bool = True) -> psycopg.Connection:
+    """
+    Connect to the test container for fixtures and assertions.
+
+    The container is on loopback: fail fast instead of waiting out the default
+    connect timeout, and skip auto-prepare — these queries run once or twice.
+    """
+    import psycopg
+
+    return psycopg.connect(url, autocommit=autocommit, prepare_threshold=None, connect_timeout=2)
+
+
+def _connection_url(postgres_container: PostgresContainer) -> str:
+    """Return the container URL in the form psycopg accepts."""
+    return postgres_container.get_connection_url().replace("postgresql+psycopg2", "postgresql")
+
+
+@pytest.fixture(scope="session")
+def admin_conn(postgres_container: PostgresContainer) -> psycopg.Connection:
+    """Session-wide connection used only to reset the tables between tests."""
+    with connect_local(_connection_url(postgres_container), autocommit=False) as conn:
+        yield conn
+
+
 @pytest.fixture()
-def dsn(postgres_container: PostgresContainer) -> str:
-    """Return a psycopg-compatible DSN and truncate all tables before each test."""
-    connection_url = postgres_container.get_connection_url().replace(
-        "postgresql+psycopg2", "postgresql"
-    )
-    with psycopg.connect(connection_url) as conn:
-        conn.execute(TRUNCATE_ALL)
-        conn.commit()
-    return connection_url
+def dsn(postgres_container: PostgresContainer, admin_conn: psycopg.Connection) -> str:
+    """
+    Return a psycopg-compatible DSN and truncate all tables before each test.
+
+    The TRUNCATE and its COMMIT go out together in pipeline mode on the
+    session's admin connection — no per-test connect, one round-trip.
+    """
+    with admin_conn.pipeline():
+        admin_conn.execute(TRUNCATE_ALL)
+        admin_conn.commit()
+    return _connection_url(postgres_container)
+
+
+@pytest.fixture(scope="session")
+def verify_conn(postgres_container: PostgresContainer) -> psycopg.Connection:
+    """
+    One autocommit connection shared by every row-count assertion in the session.
+
+    Autocommit keeps it outside any transaction, so each query sees the latest
+    committed data. Truncation in `dsn` runs on the separate `admin_conn`.
+    """
+    with connect_local(_connection_url(postgres_container)) as conn:
+        yield conn
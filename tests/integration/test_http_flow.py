@@ -15,6 +15,8 @@ Each test follows Given/When/Then BDD structure.
 
 from __future__ import annotations
 
+import json
+
 import httpx
 import pytest
 import respx
@@ -27,12 +29,27 @@ from cert_parser.adapters.http_client import (
 )
 from cert_parser.domain.models import AuthCredentials
 
+# Routes registered by happy_routes are overridden per test, so not every one
+# is called — relax respx's default assert_all_called for the module. Unmatched
+# requests still fail (assert_all_mocked).
+pytestmark = pytest.mark.respx(assert_all_called=False, assert_all_mocked=True)
+
 # ─────────────────────── Service URLs (simulated) ───────────────────────
 
 AUTH_URL = "https://keycloak.example.com/realms/app/protocol/openid-connect/token"
 LOGIN_URL = "https://api.example.com/auth/v1/login"
 DOWNLOAD_URL = "https://api.example.com/certificates/csca"
 
+ACCESS_TOKEN = "at-123"
+SFC_TOKEN = "sfc-456"
+BIN_CONTENT = b"\x30\x82\x01\x00" + b"\xCA\xFE" * 100
+
+# Built once: respx clones a route's return_value for every request it serves,
+# so the same Response can back every test.
+_RESP_ACCESS_OK = httpx.Response(200, json={"access_token": ACCESS_TOKEN})
+_RESP_SFC_OK = httpx.Response(200, text=SFC_TOKEN)
+_RESP_DOWNLOAD_OK = httpx.Response(200, content=BIN_CONTENT)
+
 # ─────────────────────── Fixtures ───────────────────────
 
 
@@ -70,6 +87,23 @@ def downloader() -> HttpBinaryDownloader:
     )
 
 
+type _Routes = tuple[respx.Route, respx.Route, respx.Route]
+
+
+@pytest.fixture()
+def happy_routes(respx_mock: respx.MockRouter) -> _Routes:
+    """
+    Register all three endpoints answering successfully.
+
+    Returns the (auth, login, download) routes; a failure test re-mocks only
+    the route it is about.
+    """
+    auth_route = respx_mock.post(AUTH_URL).mock(return_value=_RESP_ACCESS_OK)
+    login_route = respx_mock.post(LOGIN_URL).mock(return_value=_RESP_SFC_OK)
+    download_route = respx_mock.get(DOWNLOAD_URL).mock(return_value=_RESP_DOWNLOAD_OK)
+    return auth_route, login_route, download_route
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Full 3-Endpoint Flow — Happy Path
 # ═══════════════════════════════════════════════════════════════════════
@@ -84,9 +118,9 @@ class TestFullHttpFlowSuccess:
     THEN all three calls succeed and the binary content is returned.
     """
 
-    @respx.mock
     def test_full_flow_returns_binary_content(
         self,
+        happy_routes: _Routes,
         access_provider: HttpAccessTokenProvider,
         sfc_provider: HttpSfcTokenProvider,
         downloader: HttpBinaryDownloader,
@@ -96,37 +130,22 @@ class TestFullHttpFlowSuccess:
         WHEN the 3-step flow is executed
         THEN the final result contains the binary content.
         """
-        # Step 1: Keycloak responds with access_token
-        respx.post(AUTH_URL).mock(
-            return_value=httpx.Response(200, json={"access_token": "access-token-abc"})
-        )
-        # Step 2: SFC login responds with sfc_token
-        respx.post(LOGIN_URL).mock(
-            return_value=httpx.Response(200, text="sfc-token-xyz")
-        )
-        # Step 3: Download returns binary content
-        expected_bin = b"\x30\x82\x01\x00" + b"\xCA\xFE" * 100
-        respx.get(DOWNLOAD_URL).mock(
-            return_value=httpx.Response(200, content=expected_bin)
-        )
-
-        # Execute the flow
         access_result = access_provider.acquire_token()
         access_token = ResultAssertions.assert_success(access_result)
-        assert access_token == "access-token-abc"
+        assert access_token == ACCESS_TOKEN
 
         sfc_result = sfc_provider.acquire_token(access_token)
         sfc_token = ResultAssertions.assert_success(sfc_result)
-        assert sfc_token == "sfc-token-xyz"
+        assert sfc_token == SFC_TOKEN
 
         credentials = AuthCredentials(access_token=access_token, sfc_token=sfc_token)
         download_result = downloader.download(credentials)
         data = ResultAssertions.assert_success(download_result)
-        assert data == expected_bin
+        assert data == BIN_CONTENT
 
-    @respx.mock
     def test_full_flow_sends_correct_headers_at_each_step(
         self,
+        happy_routes: _Routes,
         access_provider: HttpAccessTokenProvider,
         sfc_provider: HttpSfcTokenProvider,
         downloader: HttpBinaryDownloader,
@@ -138,15 +157,7 @@ class TestFullHttpFlowSuccess:
         AND Step 2 sends Bearer header + JSON body
         AND Step 3 sends dual-token headers.
         """
-        auth_route = respx.post(AUTH_URL).mock(
-            return_value=httpx.Response(200, json={"access_token": "at-123"})
-        )
-        login_route = respx.post(LOGIN_URL).mock(
-            return_value=httpx.Response(200, text="sfc-456")
-        )
-        download_route = respx.get(DOWNLOAD_URL).mock(
-            return_value=httpx.Response(200, content=b"bin-data")
-        )
+        auth_route, login_route, download_route = happy_routes
 
         # Execute flow
         access_token = ResultAssertions.assert_success(access_provider.acquire_token())
@@ -165,16 +176,14 @@ class TestFullHttpFlowSuccess:
 
         # Verify Step 2: Bearer header + JSON body
         login_request = login_route.calls.last.request
-        assert login_request.headers["authorization"] == "Bearer at-123"
-        import json
-
+        assert login_request.headers["authorization"] == f"Bearer {ACCESS_TOKEN}"
         login_body = json.loads(login_request.content)
         assert login_body == {"borderPostId": 42, "boxId": 7, "passengerControlType": 1}
 
         # Verify Step 3: dual-token headers
         download_request = download_route.calls.last.request
-        assert download_request.headers["authorization"] == "Bearer at-123"
-        assert download_request.headers["x-sfc-authorization"] == "Bearer sfc-456"
+        assert download_request.headers["authorization"] == f"Bearer {ACCESS_TOKEN}"
+        assert download_request.headers["x-sfc-authorization"] == f"Bearer {SFC_TOKEN}"
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -189,12 +198,10 @@ class TestFlowStep1Failure:
     THEN the flow stops — Steps 2 and 3 are never attempted.
     """
 
-    @respx.mock
     def test_keycloak_401_stops_flow(
         self,
+        happy_routes: _Routes,
         access_provider: HttpAccessTokenProvider,
-        sfc_provider: HttpSfcTokenProvider,
-        downloader: HttpBinaryDownloader,
     ) -> None:
         """
         GIVEN Keycloak responds 401 (bad credentials)
@@ -202,15 +209,8 @@ class TestFlowStep1Failure:
         THEN it returns Failure(AUTHENTICATION_ERROR)
         AND no SFC login or download is attempted.
         """
-        respx.post(AUTH_URL).mock(
-            return_value=httpx.Response(401, json={"error": "invalid_grant"})
-        )
-        login_route = respx.post(LOGIN_URL).mock(
-            return_value=httpx.Response(200, text="should-not-reach")
-        )
-        download_route = respx.get(DOWNLOAD_URL).mock(
-            return_value=httpx.Response(200, content=b"should-not-reach")
-        )
+        auth_route, login_route, download_route = happy_routes
+        auth_route.mock(return_value=httpx.Response(401, json={"error": "invalid_grant"}))
 
         result = access_provider.acquire_token()
 
@@ -218,9 +218,9 @@ class TestFlowStep1Failure:
         assert not login_route.called
         assert not download_route.called
 
-    @respx.mock
     def test_keycloak_timeout_stops_flow(
         self,
+        happy_routes: _Routes,
         access_provider: HttpAccessTokenProvider,
     ) -> None:
         """
@@ -228,7 +228,8 @@ class TestFlowStep1Failure:
         WHEN acquire_access_token is called
         THEN it returns Failure (does not raise).
         """
-        respx.post(AUTH_URL).mock(side_effect=httpx.ConnectTimeout("Keycloak unreachable"))
+        auth_route, _, _ = happy_routes
+        auth_route.mock(side_effect=httpx.ConnectTimeout("Keycloak unreachable"))
 
         result = access_provider.acquire_token()
 
@@ -247,12 +248,11 @@ class TestFlowStep2Failure:
     THEN the flow stops — Step 3 is never attempted.
     """
 
-    @respx.mock
     def test_sfc_login_401_after_valid_access_token(
         self,
+        happy_routes: _Routes,
         access_provider: HttpAccessTokenProvider,
         sfc_provider: HttpSfcTokenProvider,
-        downloader: HttpBinaryDownloader,
     ) -> None:
         """
         GIVEN Keycloak returns a valid access_token
@@ -260,15 +260,8 @@ class TestFlowStep2Failure:
         WHEN the flow is executed
         THEN Step 1 succeeds, Step 2 fails with AUTHENTICATION_ERROR.
         """
-        respx.post(AUTH_URL).mock(
-            return_value=httpx.Response(200, json={"access_token": "valid-at"})
-        )
-        respx.post(LOGIN_URL).mock(
-            return_value=httpx.Response(401, json={"error": "Unauthorized"})
-        )
-        download_route = respx.get(DOWNLOAD_URL).mock(
-            return_value=httpx.Response(200, content=b"should-not-reach")
-        )
+        _, login_route, download_route = happy_routes
+        login_route.mock(return_value=httpx.Response(401, json={"error": "Unauthorized"}))
 
         access_token = ResultAssertions.assert_success(access_provider.acquire_token())
         sfc_result = sfc_provider.acquire_token(access_token)
@@ -289,9 +282,9 @@ class TestFlowStep3Failure:
     THEN download returns Failure(EXTERNAL_SERVICE_ERROR).
     """
 
-    @respx.mock
     def test_download_500_after_valid_tokens(
         self,
+        happy_routes: _Routes,
         access_provider: HttpAccessTokenProvider,
         sfc_provider: HttpSfcTokenProvider,
         downloader: HttpBinaryDownloader,
@@ -302,15 +295,8 @@ class TestFlowStep3Failure:
         WHEN download is called
         THEN it returns Failure(EXTERNAL_SERVICE_ERROR).
         """
-        respx.post(AUTH_URL).mock(
-            return_value=httpx.Response(200, json={"access_token": "at"})
-        )
-        respx.post(LOGIN_URL).mock(
-            return_value=httpx.Response(200, text="sfc")
-        )
-        respx.get(DOWNLOAD_URL).mock(
-            return_value=httpx.Response(500, text="Internal Server Error")
-        )
+        _, _, download_route = happy_routes
+        download_route.mock(return_value=httpx.Response(500, text="Internal Server Error"))
 
         access_token = ResultAssertions.assert_success(access_provider.acquire_token())
         sfc_token = ResultAssertions.assert_success(sfc_provider.acquire_token(access_token))
@@ -319,9 +305,9 @@ class TestFlowStep3Failure:
 
         ResultAssertions.assert_failure(result, ErrorCode.EXTERNAL_SERVICE_ERROR)
 
-    @respx.mock
     def test_download_network_error_after_valid_tokens(
         self,
+        happy_routes: _Routes,
         access_provider: HttpAccessTokenProvider,
         sfc_provider: HttpSfcTokenProvider,
         downloader: HttpBinaryDownloader,
@@ -332,15 +318,8 @@ class TestFlowStep3Failure:
         WHEN download is called
         THEN it returns Failure (does not raise).
         """
-        respx.post(AUTH_URL).mock(
-            return_value=httpx.Response(200, json={"access_token": "at"})
-        )
-        respx.post(LOGIN_URL).mock(
-            return_value=httpx.Response(200, text="sfc")
-        )
-        respx.get(DOWNLOAD_URL).mock(
-            side_effect=httpx.ConnectError("Connection refused")
-        )
+        _, _, download_route = happy_routes
+        download_route.mock(side_effect=httpx.ConnectError("Connection refused"))
 
         access_token = ResultAssertions.assert_success(access_provider.acquire_token())
         sfc_token = ResultAssertions.assert_success(sfc_provider.acquire_token(access_token))
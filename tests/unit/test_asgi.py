@@ -4,14 +4,32 @@ Unit tests for the FastAPI ASGI application — REST endpoints.
 Tests the /trigger endpoint for manual pipeline execution,
 as well as /health, /ready, and /info probes.
 
-Uses FastAPI's TestClient with mocked pipeline and scheduler state.
+Most tests call the route coroutines directly with the pipeline or scheduler
+state as arguments — no ASGI round-trip. One test per endpoint goes through
+FastAPI's TestClient for wire coverage, with the same state injected via
+app.dependency_overrides. Only the lifespan tests let asgi module globals be
+written (by the real lifespan), and monkeypatch restores them afterwards.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any, cast
 from unittest.mock import MagicMock
 
 import pytest
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MISSED,
+    JobExecutionEvent,
+)
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 from railway import ErrorCode, Result
 
@@ -19,18 +37,78 @@ from cert_parser import asgi
 
 
 @pytest.fixture(autouse=True)
-def _reset_asgi_state() -> None:
-    """Reset ASGI module-level state before each test."""
-    asgi._scheduler_thread = None
-    asgi._scheduler_started = False
-    asgi._scheduler_ready = False
-    asgi._error_message = None
-    asgi._pipeline_fn = None
-
-
-@pytest.fixture()
+def _fresh_app_state() -> Iterator[None]:
+    """
+    Start every test from a never-started app: no pipeline, no scheduler.
+
+    Overrides are cleared afterwards; the pipeline lock is the only module
+    state a test can leave behind.
+    """
+    _use_pipeline(None)
+    _use_state()
+    yield
+    asgi.app.dependency_overrides.clear()
+    if asgi._pipeline_lock.locked():
+        asgi._pipeline_lock.release()
+
+
+def _use_pipeline(pipeline_fn: Callable[[], Result[int]] | None) -> None:
+    """Make the routes see `pipeline_fn` as the pipeline wired at startup."""
+    asgi.app.dependency_overrides[asgi.get_pipeline_fn] = lambda: pipeline_fn
+
+
+# The probes only read `.running`; two shared stand-ins cover every test.
+_SCHEDULERS = {True: SimpleNamespace(running=True), False: SimpleNamespace(running=False)}
+
+
+def _state(
+    *,
+    scheduler_running: bool | None = None,
+    started: bool = False,
+    ready: bool = False,
+    error_message: str | None = None,
+) -> asgi.SchedulerState:
+    """Build a scheduler state snapshot (scheduler_running=None → no scheduler)."""
+    scheduler = None if scheduler_running is None else _SCHEDULERS[scheduler_running]
+    return asgi.SchedulerState(
+        scheduler=scheduler, started=started, ready=ready, error_message=error_message,
+    )
+
+
+def _use_state(
+    *,
+    scheduler_running: bool | None = None,
+    started: bool = False,
+    ready: bool = False,
+    error_message: str | None = None,
+) -> None:
+    """Make the probes served by the client see the given scheduler state."""
+    state = _state(
+        scheduler_running=scheduler_running,
+        started=started,
+        ready=ready,
+        error_message=error_message,
+    )
+    asgi.app.dependency_overrides[asgi.get_scheduler_state] = lambda: state
+
+
+def _exploding_pipeline() -> Result[int]:
+    raise RuntimeError("Unexpected kaboom")
+
+
+def _json(response: JSONResponse) -> dict[str, Any]:
+    """Decode the body of a JSONResponse returned by a route called directly."""
+    return cast("dict[str, Any]", json.loads(bytes(response.body)))
+
+
+@pytest.fixture(scope="module")
 def client() -> TestClient:
-    """Create a TestClient without running the lifespan (no real startup)."""
+    """
+    One TestClient for the module, never entered, so the lifespan never runs.
+
+    Per-test state lives in dependency_overrides (reset by _fresh_app_state),
+    so the client itself carries nothing between tests.
+    """
     return TestClient(asgi.app, raise_server_exceptions=False)
 
 
@@ -40,78 +118,159 @@ def client() -> TestClient:
 class TestTriggerEndpoint:
     """Tests for the POST /trigger endpoint — manual pipeline execution."""
 
-    def test_trigger_returns_503_when_pipeline_not_initialized(
-        self, client: TestClient,
-    ) -> None:
+    async def test_trigger_returns_503_when_pipeline_not_initialized(self) -> None:
         """
         GIVEN the application has not completed startup (pipeline_fn is None)
         WHEN POST /trigger is called
         THEN it returns 503 with an unavailable status.
         """
-        response = client.post("/trigger")
+        response = await asgi.trigger(None)
 
         assert response.status_code == 503
-        body = response.json()
+        body = _json(response)
         assert body["status"] == "unavailable"
         assert "not initialized" in body["reason"]
 
-    def test_trigger_returns_200_on_pipeline_success(
-        self, client: TestClient,
+    @pytest.mark.parametrize(
+        ("pipeline_fn", "expected_status", "body_status", "detail_key", "detail_fragment"),
+        [
+            pytest.param(
+                lambda: Result.success(42), 200, "success", "rows_stored", "42",
+                id="success",
+            ),
+            pytest.param(
+                lambda: Result.failure(ErrorCode.DATABASE_ERROR, "Connection refused"),
+                500, "failed", "message", "Connection refused",
+                id="pipeline_failure",
+            ),
+            pytest.param(
+                _exploding_pipeline, 500, "error", "error", "kaboom",
+                id="unexpected_exception",
+            ),
+        ],
+    )
+    async def test_trigger_maps_pipeline_outcome_to_response(
+        self,
+        pipeline_fn: Callable[[], Result[int]],
+        expected_status: int,
+        body_status: str,
+        detail_key: str,
+        detail_fragment: str,
     ) -> None:
         """
-        GIVEN the pipeline is initialized and succeeds with 42 rows stored
+        GIVEN the pipeline is initialized and succeeds, fails, or raises
         WHEN POST /trigger is called
+        THEN it returns 200 with rows_stored, or 500 with the failure or
+        exception message.
+        """
+        response = await asgi.trigger(pipeline_fn)
+
+        assert response.status_code == expected_status
+        body = _json(response)
+        assert body["status"] == body_status
+        assert detail_fragment in str(body[detail_key])
+
+    async def test_trigger_failure_reports_error_code(self) -> None:
+        """
+        GIVEN the pipeline fails with a database error
+        WHEN POST /trigger is called
+        THEN the response names the error code.
+        """
+        response = await asgi.trigger(
+            lambda: Result.failure(ErrorCode.DATABASE_ERROR, "Connection refused"),
+        )
+
+        assert "DATABASE" in _json(response)["error_code"]
+
+    def test_trigger_over_http_returns_rows_stored(self, client: TestClient) -> None:
+        """
+        GIVEN the pipeline is injected through dependency_overrides and succeeds
+        WHEN POST /trigger is sent through the ASGI app
         THEN it returns 200 with rows_stored=42.
         """
-        asgi._pipeline_fn = lambda: Result.success(42)
+        _use_pipeline(lambda: Result.success(42))
 
         response = client.post("/trigger")
 
         assert response.status_code == 200
-        body = response.json()
-        assert body["status"] == "success"
-        assert body["rows_stored"] == 42
+        assert response.json() == {"status": "success", "rows_stored": 42}
 
-    def test_trigger_returns_500_on_pipeline_failure(
-        self, client: TestClient,
-    ) -> None:
+    async def test_trigger_returns_409_while_run_in_progress(self) -> None:
         """
-        GIVEN the pipeline is initialized but fails with a database error
+        GIVEN a scheduled or manual pipeline run holds the pipeline lock
         WHEN POST /trigger is called
-        THEN it returns 500 with error details.
+        THEN it returns 409 without starting a second run.
         """
-        asgi._pipeline_fn = lambda: Result.failure(
-            ErrorCode.DATABASE_ERROR, "Connection refused",
-        )
+        pipeline_fn = MagicMock(return_value=Result.success(1))
+        asgi._pipeline_lock.acquire()
 
-        response = client.post("/trigger")
+        response = await asgi.trigger(pipeline_fn)
 
-        assert response.status_code == 500
-        body = response.json()
-        assert body["status"] == "failed"
-        assert "DATABASE" in body["error_code"]
-        assert "Connection refused" in body["message"]
+        assert response.status_code == 409
+        assert _json(response)["status"] == "already_running"
+        pipeline_fn.assert_not_called()
+
+    async def test_trigger_releases_lock_after_run(self) -> None:
+        """
+        GIVEN the pipeline is initialized
+        WHEN POST /trigger completes (even with an exception)
+        THEN the pipeline lock is free for the next run.
+        """
+        await asgi.trigger(_exploding_pipeline)
 
-    def test_trigger_returns_500_on_unexpected_exception(
-        self, client: TestClient,
+        assert not asgi._pipeline_lock.locked()
+
+    async def test_trigger_cancelled_before_worker_starts_leaves_lock_free(
+        self, monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """
-        GIVEN the pipeline raises an unexpected exception
-        WHEN POST /trigger is called
-        THEN it returns 500 with the exception message.
+        GIVEN the request is cancelled before the worker thread picks up the run
+        WHEN POST /trigger unwinds with CancelledError
+        THEN the pipeline lock was never taken and the pipeline never ran.
         """
+        pipeline_fn = MagicMock(return_value=Result.success(1))
 
-        def _exploding_pipeline() -> Result[int]:
-            raise RuntimeError("Unexpected kaboom")
+        async def _cancelled(func: Callable[[], object]) -> object:
+            raise asyncio.CancelledError
 
-        asgi._pipeline_fn = _exploding_pipeline
+        monkeypatch.setattr(asyncio, "to_thread", _cancelled)
 
-        response = client.post("/trigger")
+        with pytest.raises(asyncio.CancelledError):
+            await asgi.trigger(pipeline_fn)
 
-        assert response.status_code == 500
-        body = response.json()
-        assert body["status"] == "error"
-        assert "kaboom" in body["error"]
+        assert not asgi._pipeline_lock.locked()
+        pipeline_fn.assert_not_called()
+
+
+class TestExclusivePipeline:
+    """Tests for the lock wrapper used by scheduled runs."""
+
+    def test_skips_run_while_lock_is_held(self) -> None:
+        """
+        GIVEN another run holds the pipeline lock
+        WHEN the scheduled (wrapped) pipeline fires
+        THEN it returns a failure without running the pipeline.
+        """
+        pipeline_fn = MagicMock(return_value=Result.success(1))
+        asgi._pipeline_lock.acquire()
+
+        result = asgi._exclusive(pipeline_fn)()
+
+        assert result.is_failure()
+        pipeline_fn.assert_not_called()
+
+    def test_runs_and_releases_when_free(self) -> None:
+        """
+        GIVEN the pipeline lock is free
+        WHEN the scheduled (wrapped) pipeline fires
+        THEN the pipeline runs and the lock is released afterwards.
+        """
+        pipeline_fn = MagicMock(return_value=Result.success(7))
+
+        result = asgi._exclusive(pipeline_fn)()
+
+        assert result.value() == 7
+        assert not asgi._pipeline_lock.locked()
 
 
 # ─────────────────────── GET /health ───────────────────────
@@ -120,39 +279,33 @@ class TestTriggerEndpoint:
 class TestHealthEndpoint:
     """Tests for the GET /health liveness probe."""
 
-    def test_health_returns_503_when_no_scheduler_thread(
-        self, client: TestClient,
-    ) -> None:
+    async def test_health_returns_503_when_no_scheduler(self) -> None:
         """
-        GIVEN no scheduler thread is running
+        GIVEN no scheduler is running
         WHEN GET /health is called
         THEN it returns 503.
         """
-        response = client.get("/health")
+        response = await asgi.health(_state())
         assert response.status_code == 503
 
-    def test_health_returns_503_on_error(self, client: TestClient) -> None:
+    async def test_health_returns_503_on_error(self) -> None:
         """
         GIVEN a startup error occurred
         WHEN GET /health is called
         THEN it returns 503 with the error message.
         """
-        asgi._error_message = "Config broken"
-
-        response = client.get("/health")
+        response = await asgi.health(_state(error_message="Config broken"))
 
         assert response.status_code == 503
-        assert "Config broken" in response.json()["error"]
+        assert "Config broken" in _json(response)["error"]
 
-    def test_health_returns_200_with_alive_thread(self, client: TestClient) -> None:
+    def test_health_returns_200_with_running_scheduler(self, client: TestClient) -> None:
         """
-        GIVEN a scheduler thread is alive
+        GIVEN a scheduler is running
         WHEN GET /health is called
         THEN it returns 200.
         """
-        mock_thread = MagicMock()
-        mock_thread.is_alive.return_value = True
-        asgi._scheduler_thread = mock_thread
+        _use_state(scheduler_running=True)
 
         response = client.get("/health")
 
@@ -166,26 +319,33 @@ class TestHealthEndpoint:
 class TestReadyEndpoint:
     """Tests for the GET /ready readiness probe."""
 
-    def test_ready_returns_202_when_not_started(self, client: TestClient) -> None:
+    async def test_ready_returns_202_when_not_started(self) -> None:
         """
         GIVEN scheduler has not started
         WHEN GET /ready is called
         THEN it returns 202 (starting).
         """
-        response = client.get("/ready")
+        response = await asgi.ready(_state())
         assert response.status_code == 202
 
+    async def test_ready_returns_202_while_startup_sync_runs(self) -> None:
+        """
+        GIVEN the scheduler is running but the startup sync has not finished
+        WHEN GET /ready is called
+        THEN it returns 202 (starting).
+        """
+        response = await asgi.ready(_state(scheduler_running=True, started=True))
+
+        assert response.status_code == 202
+        assert _json(response)["status"] == "starting"
+
     def test_ready_returns_200_when_started(self, client: TestClient) -> None:
         """
         GIVEN the scheduler is started and ready
         WHEN GET /ready is called
         THEN it returns 200.
         """
-        mock_thread = MagicMock()
-        mock_thread.is_alive.return_value = True
-        asgi._scheduler_thread = mock_thread
-        asgi._scheduler_started = True
-        asgi._scheduler_ready = True
+        _use_state(scheduler_running=True, started=True, ready=True)
 
         response = client.get("/ready")
 
@@ -212,3 +372,128 @@ class TestInfoEndpoint:
         assert body["name"] == "cert-parser"
         assert body["version"] == "0.1.0"
         assert "scheduler_running" in body
+
+
+# ─────────────────────── Lifespan ───────────────────────
+
+
+class TestStartupRunListener:
+    """Tests for the listener that flips readiness after the startup run."""
+
+    @pytest.mark.parametrize(
+        "code", [EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED],
+        ids=["executed", "error", "missed"],
+    )
+    def test_startup_run_outcome_marks_ready(
+        self, monkeypatch: pytest.MonkeyPatch, code: int,
+    ) -> None:
+        """
+        GIVEN the service is waiting for its startup run
+        WHEN the startup job executes, fails, or is missed
+        THEN the service is marked ready (so /ready cannot stay at 202 forever).
+        """
+        monkeypatch.setattr(asgi, "_scheduler_ready", False)
+        event = JobExecutionEvent(code, "cert_parser_startup", "default", datetime.now(UTC))
+
+        asgi._on_startup_run_finished(event)
+
+        assert asgi._scheduler_ready is True
+
+    def test_other_jobs_do_not_mark_ready(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        GIVEN the service is waiting for its startup run
+        WHEN the cron sync job is missed
+        THEN readiness is unchanged.
+        """
+        monkeypatch.setattr(asgi, "_scheduler_ready", False)
+        event = JobExecutionEvent(
+            EVENT_JOB_MISSED, "cert_parser_sync", "default", datetime.now(UTC),
+        )
+
+        asgi._on_startup_run_finished(event)
+
+        assert asgi._scheduler_ready is False
+
+
+def _stub_startup(monkeypatch: pytest.MonkeyPatch, *, run_on_startup: bool) -> list[MagicMock]:
+    """
+    Let the real lifespan run against stub settings and adapters.
+
+    Returns the five stub adapters (access, sfc, downloader, parser,
+    repository). The asgi module state the lifespan writes is restored by
+    monkeypatch afterwards.
+    """
+    settings = MagicMock(log_level="INFO", run_on_startup=run_on_startup, root_path="")
+    settings.scheduler.cron = "0 */6 * * *"
+    adapters = [MagicMock() for _ in range(5)]
+    adapters[0].acquire_token.return_value = Result.failure(
+        ErrorCode.AUTHENTICATION_ERROR, "stub",
+    )
+    monkeypatch.setattr(asgi, "get_settings", lambda: settings)
+    monkeypatch.setattr(asgi, "configure_structlog", lambda level: None)
+    monkeypatch.setattr(asgi, "_create_adapters", lambda s: tuple(adapters))
+    for name in (
+        "_scheduler",
+        "_scheduler_started",
+        "_scheduler_ready",
+        "_error_message",
+        "_pipeline_fn",
+    ):
+        monkeypatch.setattr(asgi, name, getattr(asgi, name))
+    asgi.app.dependency_overrides.clear()
+    return adapters
+
+
+class TestLifespan:
+    """Runs the real lifespan, with settings and adapters stubbed."""
+
+    def test_startup_wires_routes_and_shutdown_closes_adapters(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        GIVEN valid settings with no startup run, and stub adapters
+        WHEN the app starts, serves /ready and /trigger, then shuts down
+        THEN the routes see the started scheduler and the wired pipeline
+        AND every adapter with a connection pool is closed on shutdown.
+        """
+        access, sfc, downloader, _, repository = _stub_startup(monkeypatch, run_on_startup=False)
+
+        with TestClient(asgi.app) as client:
+            ready = client.get("/ready")
+            trigger = client.post("/trigger")
+
+        assert ready.status_code == 200
+        assert trigger.status_code == 500
+        assert "stub" in trigger.json()["message"]
+        for adapter in (access, sfc, downloader, repository):
+            adapter.close.assert_called_once_with()
+
+    def test_shutdown_waits_for_in_flight_run_before_closing(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        GIVEN the startup run is still inside the pipeline when shutdown begins
+        WHEN the app shuts down
+        THEN the adapters are closed only after that run has finished.
+        """
+        adapters = _stub_startup(monkeypatch, run_on_startup=True)
+        started, release = threading.Event(), threading.Event()
+        events: list[str] = []
+
+        def _blocking_token() -> Result[str]:
+            started.set()
+            release.wait(timeout=5)
+            events.append("run_finished")
+            return Result.failure(ErrorCode.AUTHENTICATION_ERROR, "stub")
+
+        adapters[0].acquire_token.side_effect = _blocking_token
+        for adapter in adapters:
+            adapter.close.side_effect = lambda: events.append("close")
+
+        with TestClient(asgi.app):
+            assert started.wait(timeout=5)
+            # Let the run finish only once shutdown is already under way.
+            threading.Timer(0.2, release.set).start()
+
+        assert events[0] == "run_finished"
+        assert events.count("close") == 4
@@ -13,9 +13,16 @@ Test categories:
 
 from __future__ import annotations
 
+import datetime
+import re
+from functools import cache
 from uuid import UUID
 
 import pytest
+from asn1crypto import cms
+from cryptography import x509 as crypto_x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
 from railway import ErrorCode, ResultAssertions
 
 from cert_parser.adapters.cms_parser import (
@@ -27,17 +34,40 @@ from cert_parser.adapters.cms_parser import (
     _extract_outer_certificates,
     _extract_ski,
 )
-from tests.conftest import fixture_path
+from cert_parser.domain.models import MasterListPayload
+from tests.conftest import load_fixture_bytes
+
+# Either the country code or the name marks a Seychelles issuer DN.
+_SEYCHELLES_ISSUER = re.compile(r"SC|Seychelles")
+
+# Any of these in a parse failure message shows it came from the CMS decoding step.
+_CMS_ERROR_KEYWORDS = re.compile(r"cms|parse|asn1|invalid|failed", re.IGNORECASE)
+
+# Lower-case hex digits; stricter than int(s, 16), which also takes "_" and spaces.
+_HEX_DIGITS = frozenset("0123456789abcdef")
 
 # ─────────────────────── Fixtures ───────────────────────
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def parser() -> CmsMasterListParser:
-    """Create a CmsMasterListParser instance for testing."""
+    """One parser for the module — it holds no state between parse() calls."""
     return CmsMasterListParser()
 
 
+@cache
+def _parsed(filename: str) -> MasterListPayload:
+    """
+    Parse a fixture once per process and return its payload.
+
+    CMS and X.509 decoding dominate this module, so the tests that only
+    inspect the payload share one parse per .bin. Tests about parse() itself
+    (success, error paths) still call the parser directly.
+    """
+    result = CmsMasterListParser().parse(load_fixture_bytes(filename))
+    return ResultAssertions.assert_success(result, f"Failed to parse {filename}")
+
+
 # ─────────────────────── Happy Path: Small Master Lists ───────────────────────
 
 
@@ -54,75 +84,63 @@ class TestParseSeychellesMasterList:
         WHEN parsed
         THEN the result is a Success.
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
+        raw_bin = load_fixture_bytes("ml_sc.bin")
         result = parser.parse(raw_bin)
         ResultAssertions.assert_success(result)
 
-    def test_extracts_inner_certificates(self, parser: CmsMasterListParser) -> None:
+    def test_extracts_inner_certificates(self) -> None:
         """
         GIVEN ml_sc.bin
         WHEN parsed
         THEN root_cas contains at least 1 certificate from the inner Master List.
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_sc.bin")
         assert len(payload.root_cas) >= 1
 
-    def test_certificate_has_valid_der_bytes(self, parser: CmsMasterListParser) -> None:
+    def test_certificate_has_valid_der_bytes(self) -> None:
         """
         GIVEN ml_sc.bin
         WHEN parsed
         THEN each root_ca certificate field contains valid DER bytes (starts with 0x30).
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
-        for cert in payload.root_cas:
-            assert isinstance(cert.certificate, bytes)
-            assert len(cert.certificate) > 0
-            assert cert.certificate[0] == 0x30, (
-                "DER-encoded certificate must start with SEQUENCE tag"
-            )
+        payload = _parsed("ml_sc.bin")
+        ders = [cert.certificate for cert in payload.root_cas]
+        assert all(type(der) is bytes and der.startswith(b"\x30") for der in ders), (
+            "DER-encoded certificate must be non-empty bytes starting with SEQUENCE tag"
+        )
 
-    def test_certificate_has_uuid_id(self, parser: CmsMasterListParser) -> None:
+    def test_certificate_has_uuid_id(self) -> None:
         """
         GIVEN ml_sc.bin
         WHEN parsed
         THEN each certificate record has a valid UUID id.
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
-        for cert in payload.root_cas:
-            assert isinstance(cert.id, UUID)
+        payload = _parsed("ml_sc.bin")
+        assert all(type(cert.id) is UUID for cert in payload.root_cas)
 
-    def test_certificate_issuer_contains_seychelles(self, parser: CmsMasterListParser) -> None:
+    def test_certificate_issuer_contains_seychelles(self) -> None:
         """
         GIVEN ml_sc.bin (Seychelles Master List)
         WHEN parsed
         THEN at least one certificate has an issuer containing 'SC' or 'Seychelles'.
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_sc.bin")
         issuers = [c.issuer or "" for c in payload.root_cas]
-        assert any("SC" in issuer or "Seychelles" in issuer for issuer in issuers), (
+        assert any(map(_SEYCHELLES_ISSUER.search, issuers)), (
             f"Expected 'SC' or 'Seychelles' in issuers, got: {issuers}"
         )
 
-    def test_certificate_has_subject_key_identifier(self, parser: CmsMasterListParser) -> None:
+    def test_certificate_has_subject_key_identifier(self) -> None:
         """
         GIVEN ml_sc.bin
         WHEN parsed
         THEN at least one certificate has a non-empty subject_key_identifier (hex string).
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
-        skis = [c.subject_key_identifier for c in payload.root_cas]
-        assert any(ski is not None and len(ski) > 0 for ski in skis), (
-            f"Expected at least one non-empty SKI, got: {skis}"
+        payload = _parsed("ml_sc.bin")
+        # Truthiness covers both None and ""; the SKI list is built only on failure
+        assert any(c.subject_key_identifier for c in payload.root_cas), (
+            f"Expected at least one non-empty SKI, got: "
+            f"{[c.subject_key_identifier for c in payload.root_cas]}"
         )
 
 
@@ -133,41 +151,34 @@ class TestParseFranceMasterList:
     THEN it returns a MasterListPayload with many certificates.
     """
 
-    def test_extracts_many_inner_certificates(self, parser: CmsMasterListParser) -> None:
+    def test_extracts_many_inner_certificates(self) -> None:
         """
         GIVEN ml_fr.bin (France, ~83 inner certificates)
         WHEN parsed
         THEN root_cas contains at least 50 certificates.
         """
-        raw_bin = fixture_path("ml_fr.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_fr.bin")
         assert len(payload.root_cas) >= 50, (
             f"Expected ≥50 root CAs from France ML, got {len(payload.root_cas)}"
         )
 
-    def test_all_certificates_have_issuer(self, parser: CmsMasterListParser) -> None:
+    def test_all_certificates_have_issuer(self) -> None:
         """
         GIVEN ml_fr.bin
         WHEN parsed
         THEN every certificate has a non-None issuer string.
         """
-        raw_bin = fixture_path("ml_fr.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
-        for i, cert in enumerate(payload.root_cas):
-            assert cert.issuer is not None, f"Certificate #{i} has None issuer"
-            assert len(cert.issuer) > 0, f"Certificate #{i} has empty issuer"
+        payload = _parsed("ml_fr.bin")
+        missing = [i for i, cert in enumerate(payload.root_cas) if not cert.issuer]
+        assert not missing, f"Certificates with a None or empty issuer: {missing}"
 
-    def test_total_certificates_property(self, parser: CmsMasterListParser) -> None:
+    def test_total_certificates_property(self) -> None:
         """
         GIVEN ml_fr.bin
         WHEN parsed
         THEN total_certificates matches root_cas + dscs count.
         """
-        raw_bin = fixture_path("ml_fr.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_fr.bin")
         assert payload.total_certificates == len(payload.root_cas) + len(payload.dscs)
         assert payload.total_certificates >= 50
 
@@ -179,26 +190,22 @@ class TestParseBangladeshMasterList:
     THEN it returns a MasterListPayload with a small number of certificates.
     """
 
-    def test_extracts_certificates(self, parser: CmsMasterListParser) -> None:
+    def test_extracts_certificates(self) -> None:
         """
         GIVEN ml_bd.bin (Bangladesh, ~2 inner certificates)
         WHEN parsed
         THEN root_cas is non-empty.
         """
-        raw_bin = fixture_path("ml_bd.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_bd.bin")
         assert len(payload.root_cas) >= 1
 
-    def test_certificate_has_x500_issuer_bytes(self, parser: CmsMasterListParser) -> None:
+    def test_certificate_has_x500_issuer_bytes(self) -> None:
         """
         GIVEN ml_bd.bin
         WHEN parsed
         THEN each certificate has x_500_issuer as raw DER bytes.
         """
-        raw_bin = fixture_path("ml_bd.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_bd.bin")
         for cert in payload.root_cas:
             assert cert.x_500_issuer is not None
             assert isinstance(cert.x_500_issuer, bytes)
@@ -212,15 +219,13 @@ class TestParseLargeMasterList:
     THEN it handles hundreds of certificates without error.
     """
 
-    def test_parses_large_master_list(self, parser: CmsMasterListParser) -> None:
+    def test_parses_large_master_list(self) -> None:
         """
         GIVEN ml_de.bin (Germany, 300+ certificates)
         WHEN parsed
         THEN root_cas contains at least 100 certificates.
         """
-        raw_bin = fixture_path("ml_de.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_de.bin")
         assert len(payload.root_cas) >= 100, (
             f"Expected ≥100 root CAs from Germany ML, got {len(payload.root_cas)}"
         )
@@ -232,15 +237,13 @@ class TestParseLargeMasterList:
 class TestCrlExtraction:
     """Tests for CRL extraction from the CMS SignedData.crls field."""
 
-    def test_crls_list_is_present(self, parser: CmsMasterListParser) -> None:
+    def test_crls_list_is_present(self) -> None:
         """
         GIVEN any valid ML .bin
         WHEN parsed
         THEN the crls field is a list (possibly empty — not all MLs contain CRLs).
         """
-        raw_bin = fixture_path("ml_fr.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_fr.bin")
         assert isinstance(payload.crls, list)
 
 
@@ -263,126 +266,106 @@ class TestParseCompositeFixture:
         WHEN parsed
         THEN the result is a Success.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
+        raw_bin = load_fixture_bytes("ml_composite.bin")
         result = parser.parse(raw_bin)
         ResultAssertions.assert_success(result)
 
-    def test_extracts_root_cas_from_inner_and_outer(self, parser: CmsMasterListParser) -> None:
+    def test_extracts_root_cas_from_inner_and_outer(self) -> None:
         """
         GIVEN ml_composite.bin (5 inner + 3 outer = 8 root CAs)
         WHEN parsed
         THEN root_cas contains exactly 8 certificates.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         assert len(payload.root_cas) == 8
 
-    def test_extracts_crl_with_correct_country(self, parser: CmsMasterListParser) -> None:
+    def test_extracts_crl_with_correct_country(self) -> None:
         """
         GIVEN ml_composite.bin containing 1 Colombia CRL
         WHEN parsed
         THEN crls contains exactly 1 CRL with country='CO'.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         assert len(payload.crls) == 1
         assert payload.crls[0].country == "CO"
 
-    def test_crl_has_valid_der_bytes(self, parser: CmsMasterListParser) -> None:
+    def test_crl_has_valid_der_bytes(self) -> None:
         """
         GIVEN ml_composite.bin
         WHEN parsed
         THEN the CRL record contains valid DER bytes (starts with 0x30).
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         assert len(payload.crls) == 1
-        assert payload.crls[0].crl[0] == 0x30
+        assert payload.crls[0].crl.startswith(b"\x30")
 
-    def test_crl_issuer_mentions_colombia(self, parser: CmsMasterListParser) -> None:
+    def test_crl_issuer_mentions_colombia(self) -> None:
         """
         GIVEN ml_composite.bin with a Colombia CRL
         WHEN parsed
         THEN the CRL issuer string contains 'Colombia'.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         assert "Colombia" in (payload.crls[0].issuer or "")
 
-    def test_extracts_15_revoked_certificates(self, parser: CmsMasterListParser) -> None:
+    def test_extracts_15_revoked_certificates(self) -> None:
         """
         GIVEN ml_composite.bin with a Colombia CRL containing 15 revoked entries
         WHEN parsed
         THEN revoked_certificates contains exactly 15 records.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         assert len(payload.revoked_certificates) == 15
 
-    def test_revoked_entries_have_country_co(self, parser: CmsMasterListParser) -> None:
+    def test_revoked_entries_have_country_co(self) -> None:
         """
         GIVEN ml_composite.bin with a Colombia CRL
         WHEN parsed
         THEN every revoked certificate has country='CO'.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         for revoked in payload.revoked_certificates:
             assert revoked.country == "CO"
 
-    def test_revoked_entries_have_serial_numbers(self, parser: CmsMasterListParser) -> None:
+    def test_revoked_entries_have_serial_numbers(self) -> None:
         """
         GIVEN ml_composite.bin
         WHEN parsed
         THEN every revoked certificate has a non-None hex serial number (isn).
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         for revoked in payload.revoked_certificates:
             assert revoked.isn is not None
             assert revoked.isn.startswith("0x")
 
-    def test_revoked_entries_have_revocation_dates(self, parser: CmsMasterListParser) -> None:
+    def test_revoked_entries_have_revocation_dates(self) -> None:
         """
         GIVEN ml_composite.bin
         WHEN parsed
         THEN every revoked certificate has a non-None revocation_date.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         for revoked in payload.revoked_certificates:
             assert revoked.revocation_date is not None
 
-    def test_revoked_entries_reference_parent_crl(self, parser: CmsMasterListParser) -> None:
+    def test_revoked_entries_reference_parent_crl(self) -> None:
         """
         GIVEN ml_composite.bin
         WHEN parsed
         THEN every revoked certificate's crl UUID matches the CRL record's id.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         crl_id = payload.crls[0].id
         for revoked in payload.revoked_certificates:
             assert revoked.crl == crl_id
 
-    def test_total_items_includes_all_records(self, parser: CmsMasterListParser) -> None:
+    def test_total_items_includes_all_records(self) -> None:
         """
         GIVEN ml_composite.bin (8 root CAs + 1 CRL + 15 revoked)
         WHEN parsed
         THEN total_items == 8 + 0 + 1 + 15 = 24.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         assert payload.total_items == 24
 
 
@@ -402,7 +385,7 @@ class TestParseCorruptBinary:
         WHEN parsed
         THEN the result is a Failure.
         """
-        raw_bin = fixture_path("corrupt.bin").read_bytes()
+        raw_bin = load_fixture_bytes("corrupt.bin")
         result = parser.parse(raw_bin)
         ResultAssertions.assert_failure(result, ErrorCode.TECHNICAL_ERROR)
 
@@ -412,14 +395,13 @@ class TestParseCorruptBinary:
         WHEN parsed
         THEN the error message references CMS or parsing.
         """
-        raw_bin = fixture_path("corrupt.bin").read_bytes()
+        raw_bin = load_fixture_bytes("corrupt.bin")
         result = parser.parse(raw_bin)
         ResultAssertions.assert_failure(result, ErrorCode.TECHNICAL_ERROR)
         error = result.error()
-        assert any(
-            keyword in error.message.lower()
-            for keyword in ("cms", "parse", "asn1", "invalid", "failed")
-        ), f"Expected CMS-related error message, got: {error.message}"
+        assert _CMS_ERROR_KEYWORDS.search(error.message), (
+            f"Expected CMS-related error message, got: {error.message}"
+        )
 
 
 class TestParseEmptyBinary:
@@ -435,7 +417,7 @@ class TestParseEmptyBinary:
         WHEN parsed
         THEN the result is a Failure.
         """
-        raw_bin = fixture_path("empty.bin").read_bytes()
+        raw_bin = load_fixture_bytes("empty.bin")
         result = parser.parse(raw_bin)
         ResultAssertions.assert_failure(result, ErrorCode.TECHNICAL_ERROR)
 
@@ -453,7 +435,7 @@ class TestParseTruncatedBinary:
         WHEN parsed
         THEN the result is a Failure.
         """
-        raw_bin = fixture_path("truncated.bin").read_bytes()
+        raw_bin = load_fixture_bytes("truncated.bin")
         result = parser.parse(raw_bin)
         ResultAssertions.assert_failure(result, ErrorCode.TECHNICAL_ERROR)
 
@@ -485,44 +467,38 @@ class TestMetadataCorrectness:
     against known properties of ICAO CSCA certificates.
     """
 
-    def test_serial_number_is_hex_string(self, parser: CmsMasterListParser) -> None:
+    def test_serial_number_is_hex_string(self) -> None:
         """
         GIVEN ml_sc.bin
         WHEN parsed
         THEN each certificate's isn (serial number) is a hex string.
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_sc.bin")
         for cert in payload.root_cas:
             assert cert.isn is not None, "Serial number should not be None"
             # Hex string must only contain 0-9, a-f and optional 0x prefix
             isn = cert.isn.lower().removeprefix("0x")
-            assert all(c in "0123456789abcdef" for c in isn), (
+            assert _HEX_DIGITS.issuperset(isn), (
                 f"Serial number should be hex, got: {cert.isn}"
             )
 
-    def test_updated_at_is_none_for_parsed_certificates(self, parser: CmsMasterListParser) -> None:
+    def test_updated_at_is_none_for_parsed_certificates(self) -> None:
         """
         GIVEN any parsed ML
         WHEN parsed
         THEN updated_at is None (it's set by the repository, not the parser).
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_sc.bin")
         for cert in payload.root_cas:
             assert cert.updated_at is None
 
-    def test_source_is_set(self, parser: CmsMasterListParser) -> None:
+    def test_source_is_set(self) -> None:
         """
         GIVEN any parsed ML
         WHEN parsed
         THEN each certificate has a non-None source string.
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_sc.bin")
         for cert in payload.root_cas:
             assert cert.source is not None
             assert len(cert.source) > 0
@@ -556,8 +532,7 @@ class TestMultipleCountries:
         WHEN parsed
         THEN it returns Success with at least 1 root CA.
         """
-        path = fixture_path(fixture_name)
-        raw_bin = path.read_bytes()
+        raw_bin = load_fixture_bytes(fixture_name)
         result = parser.parse(raw_bin)
         payload = ResultAssertions.assert_success(result, f"Failed to parse {fixture_name}")
         assert len(payload.root_cas) >= 1, (
@@ -568,29 +543,35 @@ class TestMultipleCountries:
 # ─────────────────────── Edge Cases: None-Check Branches ───────────────────────
 
 
+@pytest.fixture(scope="module")
+def sc_signed_data() -> cms.SignedData:
+    """
+    The decoded SignedData of ml_sc.bin, shared by the None-branch tests.
+
+    A test that patches a field must restore it before returning.
+    """
+    return cms.ContentInfo.load(load_fixture_bytes("ml_sc.bin"))["content"]
+
+
 class TestExtractOuterCertificatesNone:
     """Tests for _extract_outer_certificates when CMS has no signing certificates."""
 
-    def test_returns_empty_when_certificates_set_is_none(self) -> None:
+    def test_returns_empty_when_certificates_set_is_none(
+        self, sc_signed_data: cms.SignedData,
+    ) -> None:
         """
         GIVEN a SignedData where ['certificates'] is None
         WHEN _extract_outer_certificates is called
         THEN it returns an empty list.
         """
-        from asn1crypto import cms
-
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        content_info = cms.ContentInfo.load(raw_bin)
-        signed_data = content_info["content"]
-
-        # Monkey-patch to simulate None certificates set
-        original = signed_data["certificates"]
-        signed_data["certificates"] = None
+        # Monkey-patch the shared object to simulate a None certificates set
+        original = sc_signed_data["certificates"]
+        sc_signed_data["certificates"] = None
         try:
-            result = _extract_outer_certificates(signed_data, source="test")
+            result = _extract_outer_certificates(sc_signed_data, source="test")
             assert result == []
         finally:
-            signed_data["certificates"] = original
+            sc_signed_data["certificates"] = original
 
 
 class TestExtractInnerCertificatesNone:
@@ -602,14 +583,8 @@ class TestExtractInnerCertificatesNone:
         WHEN _extract_inner_certificates is called
         THEN it returns an empty list.
         """
-        from unittest.mock import MagicMock
-
-        signed_data = MagicMock()
-        signed_data.__getitem__ = MagicMock(
-            return_value=MagicMock(
-                __getitem__=MagicMock(return_value=None),
-            ),
-        )
+        # The function only indexes signed_data["encap_content_info"]["content"]
+        signed_data = {"encap_content_info": {"content": None}}
         result = _extract_inner_certificates(signed_data, source="test")
         assert result == []
 
@@ -617,19 +592,13 @@ class TestExtractInnerCertificatesNone:
 class TestExtractCrlsNone:
     """Tests for _extract_crls when CMS has no CRL set."""
 
-    def test_returns_empty_when_crls_set_is_none(self) -> None:
+    def test_returns_empty_when_crls_set_is_none(self, sc_signed_data: cms.SignedData) -> None:
         """
         GIVEN a SignedData where ['crls'] is None
         WHEN _extract_crls is called
         THEN it returns empty lists for both CRLs and revoked entries.
         """
-        from asn1crypto import cms
-
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        content_info = cms.ContentInfo.load(raw_bin)
-        signed_data = content_info["content"]
-
-        crl_records, revoked_records = _extract_crls(signed_data, source="test")
+        crl_records, revoked_records = _extract_crls(sc_signed_data, source="test")
         assert crl_records == []
         assert revoked_records == []
 
@@ -643,11 +612,7 @@ class TestExtractCountryFromIssuer:
         WHEN _extract_country_from_issuer is called
         THEN it returns the 2-letter country code.
         """
-        from cryptography import x509 as crypto_x509
-
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        parser = CmsMasterListParser()
-        payload = ResultAssertions.assert_success(parser.parse(raw_bin))
+        payload = _parsed("ml_sc.bin")
         cert = crypto_x509.load_der_x509_certificate(payload.root_cas[0].certificate)
         country = _extract_country_from_issuer(cert.issuer)
         assert country is not None
@@ -659,8 +624,6 @@ class TestExtractCountryFromIssuer:
         WHEN _extract_country_from_issuer is called
         THEN it returns None.
         """
-        from cryptography import x509 as crypto_x509
-
         # Build a Name with only CN, no C=
         name = crypto_x509.Name(
             [
@@ -670,82 +633,55 @@ class TestExtractCountryFromIssuer:
         assert _extract_country_from_issuer(name) is None
 
 
+@pytest.fixture(scope="module")
+def cert_without_key_ids() -> crypto_x509.Certificate:
+    """
+    A minimal self-signed certificate with no SKI or AKI extension.
+
+    Key generation and signing are the slow part, and the tests only read the
+    extensions, so the certificate is built once for the module.
+    """
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = crypto_x509.Name(
+        [
+            crypto_x509.NameAttribute(crypto_x509.oid.NameOID.COMMON_NAME, "Test"),
+        ]
+    )
+    now = datetime.datetime.now(datetime.UTC)
+    return (
+        crypto_x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(crypto_x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+
+
 class TestExtractSkiAkiEdgeCases:
     """Tests for _extract_ski and _extract_aki with edge cases."""
 
-    def test_ski_returns_none_for_cert_without_ski(self) -> None:
+    def test_ski_returns_none_for_cert_without_ski(
+        self, cert_without_key_ids: crypto_x509.Certificate,
+    ) -> None:
         """
         GIVEN a self-signed certificate without SKI extension
         WHEN _extract_ski is called
         THEN it returns None.
         """
-        import datetime
-
-        from cryptography import x509 as crypto_x509
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.primitives.asymmetric import ec
-
-        key = ec.generate_private_key(ec.SECP256R1())
-        cert = (
-            crypto_x509.CertificateBuilder()
-            .subject_name(
-                crypto_x509.Name(
-                    [
-                        crypto_x509.NameAttribute(crypto_x509.oid.NameOID.COMMON_NAME, "Test"),
-                    ]
-                )
-            )
-            .issuer_name(
-                crypto_x509.Name(
-                    [
-                        crypto_x509.NameAttribute(crypto_x509.oid.NameOID.COMMON_NAME, "Test"),
-                    ]
-                )
-            )
-            .public_key(key.public_key())
-            .serial_number(crypto_x509.random_serial_number())
-            .not_valid_before(datetime.datetime.now(datetime.UTC))
-            .not_valid_after(datetime.datetime.now(datetime.UTC) + datetime.timedelta(days=1))
-            .sign(key, hashes.SHA256())
-        )
-        assert _extract_ski(cert) is None
+        assert _extract_ski(cert_without_key_ids) is None
 
-    def test_aki_returns_none_for_cert_without_aki(self) -> None:
+    def test_aki_returns_none_for_cert_without_aki(
+        self, cert_without_key_ids: crypto_x509.Certificate,
+    ) -> None:
         """
         GIVEN a self-signed certificate without AKI extension
         WHEN _extract_aki is called
         THEN it returns None.
         """
-        import datetime
-
-        from cryptography import x509 as crypto_x509
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.primitives.asymmetric import ec
-
-        key = ec.generate_private_key(ec.SECP256R1())
-        cert = (
-            crypto_x509.CertificateBuilder()
-            .subject_name(
-                crypto_x509.Name(
-                    [
-                        crypto_x509.NameAttribute(crypto_x509.oid.NameOID.COMMON_NAME, "Test"),
-                    ]
-                )
-            )
-            .issuer_name(
-                crypto_x509.Name(
-                    [
-                        crypto_x509.NameAttribute(crypto_x509.oid.NameOID.COMMON_NAME, "Test"),
-                    ]
-                )
-            )
-            .public_key(key.public_key())
-            .serial_number(crypto_x509.random_serial_number())
-            .not_valid_before(datetime.datetime.now(datetime.UTC))
-            .not_valid_after(datetime.datetime.now(datetime.UTC) + datetime.timedelta(days=1))
-            .sign(key, hashes.SHA256())
-        )
-        assert _extract_aki(cert) is None
+        assert _extract_aki(cert_without_key_ids) is None
 
 
 # ─────────────────────── Master List Issuer Extraction ───────────────────────
@@ -754,48 +690,36 @@ class TestExtractSkiAkiEdgeCases:
 class TestMasterListIssuerExtraction:
     """Verify that master_list_issuer is extracted from the CMS SignerInfo."""
 
-    def test_seychelles_certificates_have_master_list_issuer(
-        self, parser: CmsMasterListParser,
-    ) -> None:
+    def test_seychelles_certificates_have_master_list_issuer(self) -> None:
         """
         GIVEN ml_sc.bin (Seychelles Master List)
         WHEN parsed
         THEN all root CA certificates have a non-None master_list_issuer.
         """
-        raw_bin = fixture_path("ml_sc.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_sc.bin")
         for cert in payload.root_cas:
             assert cert.master_list_issuer is not None, (
                 f"Certificate {cert.issuer} missing master_list_issuer"
             )
 
-    def test_france_certificates_have_master_list_issuer(
-        self, parser: CmsMasterListParser,
-    ) -> None:
+    def test_france_certificates_have_master_list_issuer(self) -> None:
         """
         GIVEN ml_fr.bin (France Master List)
         WHEN parsed
         THEN all root CA certificates have a non-None master_list_issuer.
         """
-        raw_bin = fixture_path("ml_fr.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_fr.bin")
         assert len(payload.root_cas) > 0
         for cert in payload.root_cas:
             assert cert.master_list_issuer is not None
 
-    def test_composite_certificates_have_master_list_issuer(
-        self, parser: CmsMasterListParser,
-    ) -> None:
+    def test_composite_certificates_have_master_list_issuer(self) -> None:
         """
         GIVEN ml_composite.bin (synthetic multi-country Master List)
         WHEN parsed
         THEN all root CA certificates have a non-None master_list_issuer.
         """
-        raw_bin = fixture_path("ml_composite.bin").read_bytes()
-        result = parser.parse(raw_bin)
-        payload = ResultAssertions.assert_success(result)
+        payload = _parsed("ml_composite.bin")
         assert len(payload.root_cas) > 0
         for cert in payload.root_cas:
             assert cert.master_list_issuer is not None
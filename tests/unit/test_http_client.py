@@ -2,7 +2,8 @@
 Unit tests for the HTTP adapter — dual-token authentication and binary download.
 
 TDD RED phase — these tests are written BEFORE the implementation.
-Uses respx to mock httpx HTTP calls (never makes real HTTP requests).
+Uses respx (via its pytest respx_mock fixture) to mock httpx HTTP calls —
+never makes real HTTP requests.
 
 Tests cover the 3-endpoint authentication flow:
   1. HttpAccessTokenProvider: OpenID Connect password grant → access_token
@@ -19,6 +20,8 @@ Test categories per adapter:
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import httpx
 import pytest
 import respx
@@ -28,6 +31,7 @@ from cert_parser.adapters.http_client import (
     HttpAccessTokenProvider,
     HttpBinaryDownloader,
     HttpSfcTokenProvider,
+    create_http_client,
 )
 from cert_parser.domain.models import AuthCredentials
 
@@ -43,10 +47,28 @@ PASSWORD = "test-password"
 BORDER_POST_ID = "BOR/42/A"
 BOX_ID = "XX/99/X"
 PASSENGER_CONTROL_TYPE = "PCT/1"
+# Frozen, so one instance serves every download test.
+CREDENTIALS = AuthCredentials(access_token="at", sfc_token="sfc")
+# A DER SEQUENCE header padded to 256 bytes, standing in for a .bin bundle.
+BIN_CONTENT = b"\x30\x82\x01\x00" + bytes(252)
+
+
+@pytest.fixture(scope="module")
+def http_client() -> Iterator[httpx.Client]:
+    """
+    One pooled client for the module, injected into every adapter fixture.
+
+    Mirrors production, where create_http_client() is shared by all three
+    adapters. respx patches the transport, so the shared client still only
+    sees mocked responses. Tests that close an adapter build their own.
+    """
+    client = create_http_client(timeout=httpx.Timeout(5, connect=1))
+    yield client
+    client.close()
 
 
 @pytest.fixture()
-def access_token_provider() -> HttpAccessTokenProvider:
+def access_token_provider(http_client: httpx.Client) -> HttpAccessTokenProvider:
     """Create an HttpAccessTokenProvider with test credentials."""
     return HttpAccessTokenProvider(
         auth_url=AUTH_URL,
@@ -54,28 +76,28 @@ def access_token_provider() -> HttpAccessTokenProvider:
         client_secret=CLIENT_SECRET,
         username=USERNAME,
         password=PASSWORD,
-        timeout=5,
+        client=http_client,
     )
 
 
 @pytest.fixture()
-def sfc_token_provider() -> HttpSfcTokenProvider:
+def sfc_token_provider(http_client: httpx.Client) -> HttpSfcTokenProvider:
     """Create an HttpSfcTokenProvider with test configuration."""
     return HttpSfcTokenProvider(
         login_url=LOGIN_URL,
         border_post_id=BORDER_POST_ID,
         box_id=BOX_ID,
         passenger_control_type=PASSENGER_CONTROL_TYPE,
-        timeout=5,
+        client=http_client,
     )
 
 
 @pytest.fixture()
-def downloader() -> HttpBinaryDownloader:
+def downloader(http_client: httpx.Client) -> HttpBinaryDownloader:
     """Create an HttpBinaryDownloader with test URL."""
     return HttpBinaryDownloader(
         download_url=DOWNLOAD_URL,
-        timeout=5,
+        client=http_client,
     )
 
 
@@ -91,35 +113,36 @@ class TestAccessTokenSuccess:
     THEN acquire_token returns Result.success(token_string).
     """
 
-    @respx.mock
     def test_returns_success_with_token(
-        self, access_token_provider: HttpAccessTokenProvider
+        self, respx_mock: respx.MockRouter, access_token_provider: HttpAccessTokenProvider
     ) -> None:
         """
         GIVEN auth server responds 200 with {"access_token": "abc123"}
         WHEN acquire_token is called
         THEN it returns Success("abc123").
         """
-        respx.post(AUTH_URL).mock(return_value=httpx.Response(200, json={"access_token": "abc123"}))
+        respx_mock.post(AUTH_URL).mock(
+            return_value=httpx.Response(200, json={"access_token": "abc123"})
+        )
         result = access_token_provider.acquire_token()
         token = ResultAssertions.assert_success(result)
         assert token == "abc123"
 
-    @respx.mock
     def test_sends_password_grant_credentials(
-        self, access_token_provider: HttpAccessTokenProvider
+        self, respx_mock: respx.MockRouter, access_token_provider: HttpAccessTokenProvider
     ) -> None:
         """
         GIVEN a configured access token provider
         WHEN acquire_token is called
         THEN it POSTs with grant_type=password, client_id, client_secret, username, password.
         """
-        route = respx.post(AUTH_URL).mock(
+        route = respx_mock.post(AUTH_URL).mock(
             return_value=httpx.Response(200, json={"access_token": "token"})
         )
         access_token_provider.acquire_token()
         assert route.called
         request = route.calls.last.request
+        assert request.headers["content-type"] == "application/x-www-form-urlencoded"
         body = request.content.decode()
         assert "grant_type=password" in body
         assert CLIENT_ID in body
@@ -128,57 +151,26 @@ class TestAccessTokenSuccess:
         assert PASSWORD in body
 
 
-class TestAccessTokenAuthFailure:
+class TestAccessTokenErrorStatus:
     """
-    GIVEN invalid credentials
-    WHEN the OpenID Connect server returns 401 or 403
+    GIVEN invalid credentials (401/403) or a failing server (500)
+    WHEN the OpenID Connect server answers with that status
     THEN acquire_token returns Result.failure(AUTHENTICATION_ERROR).
     """
 
-    @respx.mock
-    def test_401_returns_authentication_error(
-        self, access_token_provider: HttpAccessTokenProvider
-    ) -> None:
-        """
-        GIVEN auth server responds 401
-        WHEN acquire_token is called
-        THEN it returns Failure(AUTHENTICATION_ERROR).
-        """
-        respx.post(AUTH_URL).mock(
-            return_value=httpx.Response(401, json={"error": "invalid_client"})
-        )
-        result = access_token_provider.acquire_token()
-        ResultAssertions.assert_failure(result, ErrorCode.AUTHENTICATION_ERROR)
-
-    @respx.mock
-    def test_403_returns_authentication_error(
-        self, access_token_provider: HttpAccessTokenProvider
+    @pytest.mark.parametrize("status", [401, 403, 500])
+    def test_error_status_returns_authentication_error(
+        self,
+        respx_mock: respx.MockRouter,
+        access_token_provider: HttpAccessTokenProvider,
+        status: int,
     ) -> None:
         """
-        GIVEN auth server responds 403
+        GIVEN auth server responds with an error status
         WHEN acquire_token is called
         THEN it returns Failure(AUTHENTICATION_ERROR).
         """
-        respx.post(AUTH_URL).mock(return_value=httpx.Response(403, json={"error": "forbidden"}))
-        result = access_token_provider.acquire_token()
-        ResultAssertions.assert_failure(result, ErrorCode.AUTHENTICATION_ERROR)
-
-
-class TestAccessTokenServerError:
-    """
-    GIVEN the OpenID Connect server is experiencing errors
-    WHEN acquire_token is called
-    THEN it returns Result.failure(AUTHENTICATION_ERROR).
-    """
-
-    @respx.mock
-    def test_500_returns_failure(self, access_token_provider: HttpAccessTokenProvider) -> None:
-        """
-        GIVEN auth server responds 500
-        WHEN acquire_token is called
-        THEN it returns Failure.
-        """
-        respx.post(AUTH_URL).mock(return_value=httpx.Response(500))
+        respx_mock.post(AUTH_URL).mock(return_value=httpx.Response(status))
         result = access_token_provider.acquire_token()
         ResultAssertions.assert_failure(result, ErrorCode.AUTHENTICATION_ERROR)
 
@@ -190,16 +182,15 @@ class TestAccessTokenTimeout:
     THEN it returns Result.failure (never raises).
     """
 
-    @respx.mock
     def test_timeout_returns_failure(
-        self, access_token_provider: HttpAccessTokenProvider
+        self, respx_mock: respx.MockRouter, access_token_provider: HttpAccessTokenProvider
     ) -> None:
         """
         GIVEN auth server times out
         WHEN acquire_token is called
         THEN it returns Failure (does not raise).
         """
-        respx.post(AUTH_URL).mock(side_effect=httpx.ConnectTimeout("timed out"))
+        respx_mock.post(AUTH_URL).mock(side_effect=httpx.ConnectTimeout("timed out"))
         result = access_token_provider.acquire_token()
         assert result.is_failure()
 
@@ -211,20 +202,75 @@ class TestAccessTokenMalformedResponse:
     THEN it returns Result.failure (never raises).
     """
 
-    @respx.mock
     def test_missing_access_token_returns_failure(
-        self, access_token_provider: HttpAccessTokenProvider
+        self, respx_mock: respx.MockRouter, access_token_provider: HttpAccessTokenProvider
     ) -> None:
         """
         GIVEN 200 with JSON missing access_token key
         WHEN acquire_token is called
         THEN it returns Failure.
         """
-        respx.post(AUTH_URL).mock(return_value=httpx.Response(200, json={"token_type": "bearer"}))
+        respx_mock.post(AUTH_URL).mock(
+            return_value=httpx.Response(200, json={"token_type": "bearer"})
+        )
         result = access_token_provider.acquire_token()
         assert result.is_failure()
 
 
+class TestAccessTokenCaching:
+    """
+    GIVEN the auth server declares an expires_in for its tokens
+    WHEN acquire_token is called repeatedly
+    THEN the cached token is reused until it is about to expire.
+    """
+
+    def test_reuses_token_within_expires_in(
+        self, respx_mock: respx.MockRouter, access_token_provider: HttpAccessTokenProvider
+    ) -> None:
+        """
+        GIVEN auth server responds with expires_in=300
+        WHEN acquire_token is called twice
+        THEN only one HTTP request is made and both calls return the same token.
+        """
+        route = respx_mock.post(AUTH_URL).mock(
+            return_value=httpx.Response(200, json={"access_token": "cached", "expires_in": 300})
+        )
+        first = ResultAssertions.assert_success(access_token_provider.acquire_token())
+        second = ResultAssertions.assert_success(access_token_provider.acquire_token())
+        assert first == second == "cached"
+        assert route.call_count == 1
+
+    def test_refreshes_when_inside_expiry_margin(
+        self, respx_mock: respx.MockRouter, access_token_provider: HttpAccessTokenProvider
+    ) -> None:
+        """
+        GIVEN auth server responds with expires_in shorter than the safety margin
+        WHEN acquire_token is called twice
+        THEN each call requests a fresh token.
+        """
+        route = respx_mock.post(AUTH_URL).mock(
+            return_value=httpx.Response(200, json={"access_token": "short", "expires_in": 10})
+        )
+        access_token_provider.acquire_token()
+        access_token_provider.acquire_token()
+        assert route.call_count == 2
+
+    def test_does_not_cache_without_expires_in(
+        self, respx_mock: respx.MockRouter, access_token_provider: HttpAccessTokenProvider
+    ) -> None:
+        """
+        GIVEN auth server omits expires_in
+        WHEN acquire_token is called twice
+        THEN each call requests a fresh token.
+        """
+        route = respx_mock.post(AUTH_URL).mock(
+            return_value=httpx.Response(200, json={"access_token": "abc"})
+        )
+        access_token_provider.acquire_token()
+        access_token_provider.acquire_token()
+        assert route.call_count == 2
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # SFC Token Provider (Step 2 — SFC login with bearer + JSON body)
 # ═══════════════════════════════════════════════════════════════════════
@@ -237,30 +283,28 @@ class TestSfcTokenSuccess:
     THEN acquire_token returns Result.success(sfc_token_string).
     """
 
-    @respx.mock
     def test_returns_success_with_sfc_token(
-        self, sfc_token_provider: HttpSfcTokenProvider
+        self, respx_mock: respx.MockRouter, sfc_token_provider: HttpSfcTokenProvider
     ) -> None:
         """
         GIVEN login server responds 200 with SFC token in body
         WHEN acquire_token("access-token") is called
         THEN it returns Success(sfc_token).
         """
-        respx.post(LOGIN_URL).mock(return_value=httpx.Response(200, text="sfc-token-xyz"))
+        respx_mock.post(LOGIN_URL).mock(return_value=httpx.Response(200, text="sfc-token-xyz"))
         result = sfc_token_provider.acquire_token("access-token")
         sfc_token = ResultAssertions.assert_success(result)
         assert sfc_token == "sfc-token-xyz"
 
-    @respx.mock
     def test_sends_bearer_token_and_json_body(
-        self, sfc_token_provider: HttpSfcTokenProvider
+        self, respx_mock: respx.MockRouter, sfc_token_provider: HttpSfcTokenProvider
     ) -> None:
         """
         GIVEN a configured SFC token provider
         WHEN acquire_token("my-access") is called
         THEN it POSTs with Authorization: Bearer my-access and JSON body with border post config.
         """
-        route = respx.post(LOGIN_URL).mock(return_value=httpx.Response(200, text="sfc"))
+        route = respx_mock.post(LOGIN_URL).mock(return_value=httpx.Response(200, text="sfc"))
         sfc_token_provider.acquire_token("my-access")
         assert route.called
         request = route.calls.last.request
@@ -273,42 +317,26 @@ class TestSfcTokenSuccess:
         assert body["passengerControlType"] == PASSENGER_CONTROL_TYPE
 
 
-class TestSfcTokenAuthFailure:
+class TestSfcTokenErrorStatus:
     """
-    GIVEN an expired or invalid access_token
-    WHEN the SFC login server returns 401
+    GIVEN an expired or invalid access_token (401) or a failing server (500)
+    WHEN the SFC login server answers with that status
     THEN acquire_token returns Result.failure(AUTHENTICATION_ERROR).
     """
 
-    @respx.mock
-    def test_401_returns_authentication_error(
-        self, sfc_token_provider: HttpSfcTokenProvider
+    @pytest.mark.parametrize("status", [401, 500])
+    def test_error_status_returns_authentication_error(
+        self,
+        respx_mock: respx.MockRouter,
+        sfc_token_provider: HttpSfcTokenProvider,
+        status: int,
     ) -> None:
         """
-        GIVEN login server responds 401
+        GIVEN login server responds with an error status
         WHEN acquire_token is called
         THEN it returns Failure(AUTHENTICATION_ERROR).
         """
-        respx.post(LOGIN_URL).mock(return_value=httpx.Response(401))
-        result = sfc_token_provider.acquire_token("expired-token")
-        ResultAssertions.assert_failure(result, ErrorCode.AUTHENTICATION_ERROR)
-
-
-class TestSfcTokenServerError:
-    """
-    GIVEN the SFC login server is experiencing errors
-    WHEN acquire_token is called
-    THEN it returns Result.failure(AUTHENTICATION_ERROR).
-    """
-
-    @respx.mock
-    def test_500_returns_failure(self, sfc_token_provider: HttpSfcTokenProvider) -> None:
-        """
-        GIVEN login server responds 500
-        WHEN acquire_token is called
-        THEN it returns Failure.
-        """
-        respx.post(LOGIN_URL).mock(return_value=httpx.Response(500))
+        respx_mock.post(LOGIN_URL).mock(return_value=httpx.Response(status))
         result = sfc_token_provider.acquire_token("token")
         ResultAssertions.assert_failure(result, ErrorCode.AUTHENTICATION_ERROR)
 
@@ -320,18 +348,65 @@ class TestSfcTokenTimeout:
     THEN it returns Result.failure (never raises).
     """
 
-    @respx.mock
-    def test_timeout_returns_failure(self, sfc_token_provider: HttpSfcTokenProvider) -> None:
+    def test_timeout_returns_failure(
+        self, respx_mock: respx.MockRouter, sfc_token_provider: HttpSfcTokenProvider
+    ) -> None:
         """
         GIVEN login server times out
         WHEN acquire_token is called
         THEN it returns Failure (does not raise).
         """
-        respx.post(LOGIN_URL).mock(side_effect=httpx.ConnectTimeout("timed out"))
+        respx_mock.post(LOGIN_URL).mock(side_effect=httpx.ConnectTimeout("timed out"))
         result = sfc_token_provider.acquire_token("token")
         assert result.is_failure()
 
 
+class TestSfcTokenCaching:
+    """
+    GIVEN an SFC token provider configured with a token TTL
+    WHEN acquire_token is called repeatedly
+    THEN the token is reused only for the same access token.
+    """
+
+    def test_reuses_token_for_same_access_token(
+        self, respx_mock: respx.MockRouter, http_client: httpx.Client
+    ) -> None:
+        """
+        GIVEN token_ttl_seconds=600
+        WHEN acquire_token("at") is called twice
+        THEN only one login request is made.
+        """
+        provider = HttpSfcTokenProvider(
+            login_url=LOGIN_URL,
+            border_post_id=BORDER_POST_ID,
+            box_id=BOX_ID,
+            passenger_control_type=PASSENGER_CONTROL_TYPE,
+            token_ttl_seconds=600,
+            client=http_client,
+        )
+        route = respx_mock.post(LOGIN_URL).mock(return_value=httpx.Response(200, text="sfc"))
+        provider.acquire_token("at")
+        result = provider.acquire_token("at")
+        assert ResultAssertions.assert_success(result) == "sfc"
+        assert route.call_count == 1
+
+        provider.acquire_token("other-at")
+        assert route.call_count == 2
+
+    def test_no_caching_by_default(
+        self, respx_mock: respx.MockRouter, sfc_token_provider: HttpSfcTokenProvider
+    ) -> None:
+        """
+        GIVEN the default token_ttl_seconds=0
+        WHEN acquire_token is called twice
+        THEN each call performs a login request.
+        """
+        route = respx_mock.post(LOGIN_URL).mock(return_value=httpx.Response(200, text="sfc"))
+        sfc_token_provider.acquire_token("at")
+        sfc_token_provider.acquire_token("at")
+        assert route.call_count == 2
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Binary Download (Step 3 — dual-token authentication)
 # ═══════════════════════════════════════════════════════════════════════
@@ -344,73 +419,56 @@ class TestBinaryDownloadSuccess:
     THEN download returns Result.success(bytes).
     """
 
-    @respx.mock
-    def test_returns_success_with_bytes(self, downloader: HttpBinaryDownloader) -> None:
+    def test_returns_success_with_bytes(
+        self, respx_mock: respx.MockRouter, downloader: HttpBinaryDownloader
+    ) -> None:
         """
         GIVEN download server responds 200 with binary body
-        WHEN download(credentials) is called
+        WHEN download(CREDENTIALS) is called
         THEN it returns Success(binary_content).
         """
-        content = b"\x30\x82\x01\x00" + b"\x00" * 252
-        credentials = AuthCredentials(access_token="at", sfc_token="sfc")
-        respx.get(DOWNLOAD_URL).mock(return_value=httpx.Response(200, content=content))
-        result = downloader.download(credentials)
+        respx_mock.get(DOWNLOAD_URL).mock(return_value=httpx.Response(200, content=BIN_CONTENT))
+        result = downloader.download(CREDENTIALS)
         data = ResultAssertions.assert_success(result)
-        assert data == content
+        assert data == BIN_CONTENT
 
-    @respx.mock
-    def test_sends_dual_token_headers(self, downloader: HttpBinaryDownloader) -> None:
+    def test_sends_dual_token_headers(
+        self, respx_mock: respx.MockRouter, downloader: HttpBinaryDownloader
+    ) -> None:
         """
-        GIVEN AuthCredentials(access_token="at", sfc_token="sfc")
-        WHEN download(credentials) is called
+        GIVEN CREDENTIALS (access_token="at", sfc_token="sfc")
+        WHEN download(CREDENTIALS) is called
         THEN it sends Authorization: Bearer at AND x-sfc-authorization: Bearer sfc.
         """
-        credentials = AuthCredentials(access_token="at", sfc_token="sfc")
-        route = respx.get(DOWNLOAD_URL).mock(return_value=httpx.Response(200, content=b"data"))
-        downloader.download(credentials)
+        route = respx_mock.get(DOWNLOAD_URL).mock(return_value=httpx.Response(200, content=b"data"))
+        downloader.download(CREDENTIALS)
         assert route.called
         request = route.calls.last.request
         assert request.headers["authorization"] == "Bearer at"
         assert request.headers["x-sfc-authorization"] == "Bearer sfc"
 
 
-class TestBinaryDownloadAuthFailure:
+class TestBinaryDownloadErrorStatus:
     """
-    GIVEN an expired or invalid token
-    WHEN the download server returns 401
+    GIVEN an expired or invalid token (401) or a failing server (500)
+    WHEN the download server answers with that status
     THEN download returns Result.failure(EXTERNAL_SERVICE_ERROR).
     """
 
-    @respx.mock
-    def test_401_returns_failure(self, downloader: HttpBinaryDownloader) -> None:
-        """
-        GIVEN download server responds 401
-        WHEN download is called
-        THEN it returns Failure(EXTERNAL_SERVICE_ERROR).
-        """
-        credentials = AuthCredentials(access_token="expired", sfc_token="expired")
-        respx.get(DOWNLOAD_URL).mock(return_value=httpx.Response(401))
-        result = downloader.download(credentials)
-        ResultAssertions.assert_failure(result, ErrorCode.EXTERNAL_SERVICE_ERROR)
-
-
-class TestBinaryDownloadServerError:
-    """
-    GIVEN the download server is experiencing errors
-    WHEN download is called
-    THEN it returns Result.failure(EXTERNAL_SERVICE_ERROR).
-    """
-
-    @respx.mock
-    def test_500_returns_failure(self, downloader: HttpBinaryDownloader) -> None:
+    @pytest.mark.parametrize("status", [401, 500])
+    def test_error_status_returns_failure(
+        self,
+        respx_mock: respx.MockRouter,
+        downloader: HttpBinaryDownloader,
+        status: int,
+    ) -> None:
         """
-        GIVEN download server responds 500
+        GIVEN download server responds with an error status
         WHEN download is called
         THEN it returns Failure(EXTERNAL_SERVICE_ERROR).
         """
-        credentials = AuthCredentials(access_token="at", sfc_token="sfc")
-        respx.get(DOWNLOAD_URL).mock(return_value=httpx.Response(500))
-        result = downloader.download(credentials)
+        respx_mock.get(DOWNLOAD_URL).mock(return_value=httpx.Response(status))
+        result = downloader.download(CREDENTIALS)
         ResultAssertions.assert_failure(result, ErrorCode.EXTERNAL_SERVICE_ERROR)
 
 
@@ -421,16 +479,16 @@ class TestBinaryDownloadTimeout:
     THEN it returns Result.failure (never raises).
     """
 
-    @respx.mock
-    def test_timeout_returns_failure(self, downloader: HttpBinaryDownloader) -> None:
+    def test_timeout_returns_failure(
+        self, respx_mock: respx.MockRouter, downloader: HttpBinaryDownloader
+    ) -> None:
         """
         GIVEN download server times out
         WHEN download is called
         THEN it returns Failure (does not raise).
         """
-        credentials = AuthCredentials(access_token="at", sfc_token="sfc")
-        respx.get(DOWNLOAD_URL).mock(side_effect=httpx.ReadTimeout("timed out"))
-        result = downloader.download(credentials)
+        respx_mock.get(DOWNLOAD_URL).mock(side_effect=httpx.ReadTimeout("timed out"))
+        result = downloader.download(CREDENTIALS)
         assert result.is_failure()
 
 
@@ -441,14 +499,86 @@ class TestBinaryDownloadNetworkError:
     THEN it returns Result.failure (never raises).
     """
 
-    @respx.mock
-    def test_network_error_returns_failure(self, downloader: HttpBinaryDownloader) -> None:
+    def test_network_error_returns_failure(
+        self, respx_mock: respx.MockRouter, downloader: HttpBinaryDownloader
+    ) -> None:
         """
         GIVEN network connection fails
         WHEN download is called
         THEN it returns Failure.
         """
-        credentials = AuthCredentials(access_token="at", sfc_token="sfc")
-        respx.get(DOWNLOAD_URL).mock(side_effect=httpx.ConnectError("connection refused"))
-        result = downloader.download(credentials)
+        respx_mock.get(DOWNLOAD_URL).mock(side_effect=httpx.ConnectError("connection refused"))
+        result = downloader.download(CREDENTIALS)
         assert result.is_failure()
+
+
+class TestBinaryDownloadPooledClient:
+    """
+    GIVEN a downloader holding one long-lived httpx.Client
+    WHEN it is used across several runs and then closed
+    THEN calls reuse the client until close(), after which they fail cleanly.
+    """
+
+    def test_repeated_downloads_reuse_client(
+        self, respx_mock: respx.MockRouter, downloader: HttpBinaryDownloader
+    ) -> None:
+        """
+        GIVEN download server responds 200
+        WHEN download is called twice
+        THEN both calls succeed through the same pooled client.
+        """
+        route = respx_mock.get(DOWNLOAD_URL).mock(return_value=httpx.Response(200, content=b"data"))
+        client = downloader._client
+        ResultAssertions.assert_success(downloader.download(CREDENTIALS))
+        ResultAssertions.assert_success(downloader.download(CREDENTIALS))
+        assert route.call_count == 2
+        assert downloader._client is client
+
+    def test_download_after_close_returns_failure(self) -> None:
+        """
+        GIVEN the downloader has been closed
+        WHEN download is called
+        THEN it returns Failure(EXTERNAL_SERVICE_ERROR) instead of raising.
+        """
+        # Own client: closing the shared module client would break later tests
+        downloader = HttpBinaryDownloader(download_url=DOWNLOAD_URL, timeout=5)
+        downloader.close()
+        result = downloader.download(CREDENTIALS)
+        ResultAssertions.assert_failure(result, ErrorCode.EXTERNAL_SERVICE_ERROR)
+
+    def test_adapters_share_injected_client(self, respx_mock: respx.MockRouter) -> None:
+        """
+        GIVEN one client from create_http_client passed to all three adapters
+        WHEN the full token + download flow runs
+        THEN every call goes through that single shared client.
+        """
+        with create_http_client(timeout=5) as shared:
+            access = HttpAccessTokenProvider(
+                AUTH_URL, CLIENT_ID, CLIENT_SECRET, USERNAME, PASSWORD, client=shared,
+            )
+            sfc = HttpSfcTokenProvider(
+                LOGIN_URL, BORDER_POST_ID, BOX_ID, PASSENGER_CONTROL_TYPE, client=shared,
+            )
+            downloader = HttpBinaryDownloader(DOWNLOAD_URL, client=shared)
+            respx_mock.post(AUTH_URL).mock(
+                return_value=httpx.Response(200, json={"access_token": "at"})
+            )
+            respx_mock.post(LOGIN_URL).mock(return_value=httpx.Response(200, text="sfc"))
+            respx_mock.get(DOWNLOAD_URL).mock(return_value=httpx.Response(200, content=b"data"))
+
+            access_token = ResultAssertions.assert_success(access.acquire_token())
+            sfc_token = ResultAssertions.assert_success(sfc.acquire_token(access_token))
+            credentials = AuthCredentials(access_token=access_token, sfc_token=sfc_token)
+            ResultAssertions.assert_success(downloader.download(credentials))
+
+            assert access._client is sfc._client is downloader._client is shared
+
+    def test_numeric_timeout_caps_connect_and_pool(self) -> None:
+        """
+        GIVEN create_http_client is given a plain number of seconds
+        WHEN the client is built
+        THEN that number is the read/write budget, while connect and pool
+        acquisition get their own shorter limits.
+        """
+        with create_http_client(timeout=60) as client:
+            assert client.timeout == httpx.Timeout(60, connect=10, pool=5)
@@ -7,11 +7,23 @@ without making real HTTP calls or database connections.
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
 import structlog
 
 from cert_parser.main import configure_structlog
 
 
+@pytest.fixture(autouse=True)
+def _reset_structlog() -> Iterator[None]:
+    """Undo each test's structlog.configure() so no level leaks into the next."""
+    yield
+    structlog.reset_defaults()
+
+
 class TestConfigureStructlog:
     """Verify structlog configuration function."""
 
@@ -19,12 +31,10 @@ class TestConfigureStructlog:
         """
         GIVEN log_level="WARNING"
         WHEN configure_structlog is called
-        THEN structlog is configured (no exception raised).
+        THEN loggers filter below WARNING.
         """
         configure_structlog("WARNING")
-        log = structlog.get_logger()
-        # Verify it's callable — structlog was configured without error
-        assert log is not None
+        assert structlog.get_logger().get_effective_level() == logging.WARNING
 
     def test_configure_structlog_defaults_to_info(self) -> None:
         """
@@ -33,8 +43,7 @@ class TestConfigureStructlog:
         THEN structlog is configured at INFO level.
         """
         configure_structlog()
-        log = structlog.get_logger()
-        assert log is not None
+        assert structlog.get_logger().get_effective_level() == logging.INFO
 
     def test_configure_structlog_invalid_level_falls_back(self) -> None:
         """
@@ -43,5 +52,28 @@ class TestConfigureStructlog:
         THEN it falls back to INFO (no crash).
         """
         configure_structlog("NONEXISTENT")
-        log = structlog.get_logger()
-        assert log is not None
+        assert structlog.get_logger().get_effective_level() == logging.INFO
+
+    def test_configure_structlog_renders_json_when_not_a_tty(self) -> None:
+        """
+        GIVEN stdout is not a terminal (as in a container or under pytest capture)
+        WHEN configure_structlog is called
+        THEN the final processor renders JSON lines.
+        """
+        with patch("cert_parser.main.sys.stdout.isatty", return_value=False):
+            configure_structlog()
+
+        processors = structlog.get_config()["processors"]
+        assert isinstance(processors[-1], structlog.processors.JSONRenderer)
+
+    def test_configure_structlog_renders_console_on_a_tty(self) -> None:
+        """
+        GIVEN stdout is an interactive terminal
+        WHEN configure_structlog is called
+        THEN the final processor is the human-readable ConsoleRenderer.
+        """
+        with patch("cert_parser.main.sys.stdout.isatty", return_value=True):
+            configure_structlog()
+
+        processors = structlog.get_config()["processors"]
+        assert isinstance(processors[-1], structlog.dev.ConsoleRenderer)
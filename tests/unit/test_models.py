@@ -50,21 +50,27 @@ class TestCertificateRecord:
         with pytest.raises(AttributeError):
             cert.issuer = "modified"  # type: ignore[misc]
 
-    def test_optional_fields_default_to_none(self) -> None:
+    @pytest.mark.parametrize(
+        "field_name",
+        [
+            "subject_key_identifier",
+            "authority_key_identifier",
+            "issuer",
+            "master_list_issuer",
+            "x_500_issuer",
+            "source",
+            "isn",
+            "updated_at",
+        ],
+    )
+    def test_optional_fields_default_to_none(self, field_name: str) -> None:
         """
         GIVEN a CertificateRecord with only required fields
-        WHEN accessed
-        THEN optional fields are None.
+        WHEN an optional field is accessed
+        THEN it is None.
         """
         cert = CertificateRecord(certificate=b"\x30\x00")
-        assert cert.issuer is None
-        assert cert.master_list_issuer is None
-        assert cert.subject_key_identifier is None
-        assert cert.authority_key_identifier is None
-        assert cert.x_500_issuer is None
-        assert cert.source is None
-        assert cert.isn is None
-        assert cert.updated_at is None
+        assert getattr(cert, field_name) is None
 
 
 class TestMasterListPayload:
@@ -19,58 +19,100 @@ Test categories:
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
 
+import pytest
 from railway import ErrorCode, Result, ResultAssertions
 
 from cert_parser.domain.models import AuthCredentials, CertificateRecord, MasterListPayload
+from cert_parser.domain.ports import (
+    AccessTokenProvider,
+    BinaryDownloader,
+    CertificateRepository,
+    MasterListParser,
+    SfcTokenProvider,
+)
 from cert_parser.pipeline import run_pipeline
 
-# ─────────────────────── Mock Port Factories ───────────────────────
+# A minimal valid payload. The pipeline only passes it through, so one
+# instance is shared by every test; nothing may mutate its lists.
+_SAMPLE_PAYLOAD = MasterListPayload(
+    root_cas=[
+        CertificateRecord(certificate=b"\x30\x82\x01\x00", source="test"),
+    ],
+)
 
+# Default port results. Success and Failure are frozen, so the instances are
+# shared by every test rather than rebuilt per test.
+_OK_TOKEN = Result.success("token")
+_OK_SFC = Result.success("sfc")
+_OK_BINARY = Result.success(b"data")
+_OK_PAYLOAD = Result.success(_SAMPLE_PAYLOAD)
+_OK_ROWS = Result.success(1)
+_FAIL_STAGE: Result[Any] = Result.failure(ErrorCode.TECHNICAL_ERROR, "stage failed")
 
-def _make_access_token_provider(result: Result[str]) -> MagicMock:
-    """Create a mock AccessTokenProvider returning the given Result."""
-    mock = MagicMock()
-    mock.acquire_token.return_value = result
-    return mock
+# ─────────────────────── Mock Ports ───────────────────────
 
 
-def _make_sfc_token_provider(result: Result[str]) -> MagicMock:
-    """Create a mock SfcTokenProvider returning the given Result."""
-    mock = MagicMock()
-    mock.acquire_token.return_value = result
-    return mock
+@pytest.fixture(scope="module")
+def _port_mocks() -> SimpleNamespace:
+    """
+    The five port mocks, built once for the module and reset per test by `ports`.
 
+    Plain Mock specced to each port Protocol: no magic-method setup, and a
+    typo'd port method fails instead of silently returning a child mock.
+    """
+    return SimpleNamespace(
+        access_tp=Mock(spec=AccessTokenProvider),
+        sfc_tp=Mock(spec=SfcTokenProvider),
+        downloader=Mock(spec=BinaryDownloader),
+        parser=Mock(spec=MasterListParser),
+        repository=Mock(spec=CertificateRepository),
+    )
 
-def _make_downloader(result: Result[bytes]) -> MagicMock:
-    """Create a mock BinaryDownloader returning the given Result."""
-    mock = MagicMock()
-    mock.download.return_value = result
-    return mock
 
+@pytest.fixture()
+def ports(_port_mocks: SimpleNamespace) -> SimpleNamespace:
+    """
+    Port mocks with no recorded calls, every one returning success.
 
-def _make_parser(result: Result[MasterListPayload]) -> MagicMock:
-    """Create a mock MasterListParser returning the given Result."""
-    mock = MagicMock()
-    mock.parse.return_value = result
-    return mock
+    Tests make a stage fail (or return a specific value) by overriding its
+    return_value; the next test gets the success defaults back.
+    """
+    for mock in vars(_port_mocks).values():
+        mock.reset_mock()
+    _port_mocks.access_tp.acquire_token.return_value = _OK_TOKEN
+    _port_mocks.sfc_tp.acquire_token.return_value = _OK_SFC
+    _port_mocks.downloader.download.return_value = _OK_BINARY
+    _port_mocks.parser.parse.return_value = _OK_PAYLOAD
+    _port_mocks.repository.store.return_value = _OK_ROWS
+    return _port_mocks
+
+
+def _run(ports: SimpleNamespace) -> Result[int]:
+    """Run the pipeline against the given port mocks."""
+    return run_pipeline(
+        ports.access_tp, ports.sfc_tp, ports.downloader, ports.parser, ports.repository,
+    )
 
 
-def _make_repository(result: Result[int]) -> MagicMock:
-    """Create a mock CertificateRepository returning the given Result."""
-    mock = MagicMock()
-    mock.store.return_value = result
-    return mock
+# Stage name → (ports attribute, port method) it is served by.
+_STAGE_METHODS = {
+    "access": ("access_tp", "acquire_token"),
+    "sfc": ("sfc_tp", "acquire_token"),
+    "download": ("downloader", "download"),
+    "parse": ("parser", "parse"),
+    "store": ("repository", "store"),
+}
 
 
-def _sample_payload() -> MasterListPayload:
-    """Create a minimal valid MasterListPayload for testing."""
-    return MasterListPayload(
-        root_cas=[
-            CertificateRecord(certificate=b"\x30\x82\x01\x00", source="test"),
-        ],
-    )
+def _stage_method(ports: SimpleNamespace, stage: str) -> Mock:
+    """Return the mocked port method that serves the given pipeline stage."""
+    port, method = _STAGE_METHODS[stage]
+    mock: Mock = getattr(getattr(ports, port), method)
+    return mock
 
 
 # ─────────────────────── Success Track ───────────────────────
@@ -83,224 +125,90 @@ class TestPipelineSuccess:
     THEN it returns Result.success with the row count from the repository.
     """
 
-    def test_returns_success_with_row_count(self) -> None:
+    def test_returns_success_with_row_count(self, ports: SimpleNamespace) -> None:
         """
-        GIVEN access_token="abc", sfc_token="sfc-xyz", download=binary, parse=payload, store=42
+        GIVEN every port succeeds and store reports 42 rows
         WHEN run_pipeline is called
         THEN it returns Success(42).
         """
-        access_tp = _make_access_token_provider(Result.success("abc-token"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc-xyz"))
-        downloader = _make_downloader(Result.success(b"\x30\x82"))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(42))
+        ports.repository.store.return_value = Result.success(42)
 
-        result = run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
+        result = _run(ports)
 
         rows = ResultAssertions.assert_success(result)
         assert rows == 42
 
-    def test_calls_all_ports_in_order(self) -> None:
+    def test_calls_each_port_once_with_previous_output(self, ports: SimpleNamespace) -> None:
         """
-        GIVEN all ports succeed
-        WHEN run_pipeline is called
-        THEN all five ports are called exactly once.
+        GIVEN all ports succeed, with access_token="at" and sfc_token="sfc"
+        WHEN run_pipeline is called once
+        THEN all five ports are called exactly once
+        AND sfc_token_provider receives "at"
+        AND downloader receives AuthCredentials(access_token="at", sfc_token="sfc")
+        AND parser receives the downloaded bytes
+        AND repository.store receives the parser's payload object itself.
         """
-        access_tp = _make_access_token_provider(Result.success("token"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc-token"))
-        downloader = _make_downloader(Result.success(b"data"))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(10))
-
-        run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
+        ports.access_tp.acquire_token.return_value = Result.success("at")
 
-        access_tp.acquire_token.assert_called_once()
-        sfc_tp.acquire_token.assert_called_once_with("token")
-        downloader.download.assert_called_once()
-        parser.parse.assert_called_once_with(b"data")
-        repository.store.assert_called_once()
+        _run(ports)
 
-    def test_passes_access_token_to_sfc_provider(self) -> None:
-        """
-        GIVEN access_token_provider returns "my-access-token"
-        WHEN run_pipeline is called
-        THEN sfc_token_provider.acquire_token receives "my-access-token".
-        """
-        access_tp = _make_access_token_provider(Result.success("my-access-token"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.success(b"binary"))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(5))
-
-        run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
-
-        sfc_tp.acquire_token.assert_called_once_with("my-access-token")
-
-    def test_passes_auth_credentials_to_downloader(self) -> None:
-        """
-        GIVEN access_token="at" and sfc_token="sfc"
-        WHEN run_pipeline is called
-        THEN downloader.download receives AuthCredentials(access_token="at", sfc_token="sfc").
-        """
-        access_tp = _make_access_token_provider(Result.success("at"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.success(b"binary"))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(1))
-
-        run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
-
-        expected_creds = AuthCredentials(access_token="at", sfc_token="sfc")
-        downloader.download.assert_called_once_with(expected_creds)
-
-    def test_passes_payload_to_repository(self) -> None:
-        """
-        GIVEN parser returns a MasterListPayload
-        WHEN run_pipeline is called
-        THEN repository.store receives that exact payload.
-        """
-        payload = _sample_payload()
-        access_tp = _make_access_token_provider(Result.success("token"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.success(b"data"))
-        parser = _make_parser(Result.success(payload))
-        repository = _make_repository(Result.success(1))
-
-        run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
-
-        repository.store.assert_called_once_with(payload)
+        counts = tuple(_stage_method(ports, stage).call_count for stage in _STAGE_METHODS)
+        assert counts == (1, 1, 1, 1, 1)
+        assert ports.sfc_tp.acquire_token.call_args.args == ("at",)
+        credentials = ports.downloader.download.call_args.args[0]
+        assert isinstance(credentials, AuthCredentials)
+        assert (credentials.access_token, credentials.sfc_token) == ("at", "sfc")
+        assert ports.parser.parse.call_args.args == (b"data",)
+        assert ports.repository.store.call_args.args[0] is _SAMPLE_PAYLOAD
 
 
 # ─────────────────────── Failure at Each Stage ───────────────────────
 
 
-class TestPipelineAccessTokenFailure:
-    """
-    GIVEN access token acquisition fails
-    WHEN run_pipeline is called
-    THEN it returns Result.failure(AUTHENTICATION_ERROR).
-    """
-
-    def test_returns_authentication_error(self) -> None:
-        """
-        GIVEN access_token_provider returns Failure(AUTHENTICATION_ERROR)
-        WHEN run_pipeline is called
-        THEN pipeline returns Failure(AUTHENTICATION_ERROR).
-        """
-        access_tp = _make_access_token_provider(
-            Result.failure(ErrorCode.AUTHENTICATION_ERROR, "invalid credentials")
-        )
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.success(b""))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(0))
-
-        result = run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
+# Each stage paired with the error code its port reports on failure.
+STAGE_FAILURES = [
+    pytest.param("access", ErrorCode.AUTHENTICATION_ERROR, id="access_token"),
+    pytest.param("sfc", ErrorCode.AUTHENTICATION_ERROR, id="sfc_token"),
+    pytest.param("download", ErrorCode.EXTERNAL_SERVICE_ERROR, id="download"),
+    pytest.param("parse", ErrorCode.TECHNICAL_ERROR, id="parse"),
+    pytest.param("store", ErrorCode.DATABASE_ERROR, id="store"),
+]
 
-        ResultAssertions.assert_failure(result, ErrorCode.AUTHENTICATION_ERROR)
 
-
-class TestPipelineSfcTokenFailure:
+class TestPipelineStageFailure:
     """
-    GIVEN SFC login fails
+    GIVEN one stage's port returns a failure
     WHEN run_pipeline is called
-    THEN it returns Result.failure(AUTHENTICATION_ERROR).
+    THEN the pipeline returns that failure unchanged.
     """
 
-    def test_returns_authentication_error(self) -> None:
+    @pytest.mark.parametrize(("failing_stage", "expected_code"), STAGE_FAILURES)
+    def test_failure_propagates(
+        self, ports: SimpleNamespace, failing_stage: str, expected_code: ErrorCode
+    ) -> None:
         """
-        GIVEN sfc_token_provider returns Failure(AUTHENTICATION_ERROR)
+        GIVEN every port succeeds except the one for failing_stage
         WHEN run_pipeline is called
-        THEN pipeline returns Failure(AUTHENTICATION_ERROR).
+        THEN pipeline returns Failure(expected_code).
         """
-        access_tp = _make_access_token_provider(Result.success("token"))
-        sfc_tp = _make_sfc_token_provider(
-            Result.failure(ErrorCode.AUTHENTICATION_ERROR, "SFC login failed")
-        )
-        downloader = _make_downloader(Result.success(b""))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(0))
-
-        result = run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
+        failure: Result[Any] = Result.failure(expected_code, f"{failing_stage} failed")
+        _stage_method(ports, failing_stage).return_value = failure
 
-        ResultAssertions.assert_failure(result, ErrorCode.AUTHENTICATION_ERROR)
+        result = _run(ports)
 
+        ResultAssertions.assert_failure(result, expected_code)
 
-class TestPipelineDownloadFailure:
-    """
-    GIVEN download fails
-    WHEN run_pipeline is called
-    THEN it returns Result.failure(EXTERNAL_SERVICE_ERROR).
-    """
 
-    def test_returns_external_service_error(self) -> None:
-        """
-        GIVEN downloader returns Failure(EXTERNAL_SERVICE_ERROR)
-        WHEN run_pipeline is called
-        THEN pipeline returns Failure(EXTERNAL_SERVICE_ERROR).
-        """
-        access_tp = _make_access_token_provider(Result.success("token"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.failure(ErrorCode.EXTERNAL_SERVICE_ERROR, "HTTP 500"))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(0))
-
-        result = run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
-
-        ResultAssertions.assert_failure(result, ErrorCode.EXTERNAL_SERVICE_ERROR)
-
-
-class TestPipelineParseFailure:
-    """
-    GIVEN parsing fails
-    WHEN run_pipeline is called
-    THEN it returns Result.failure(TECHNICAL_ERROR).
-    """
-
-    def test_returns_technical_error(self) -> None:
-        """
-        GIVEN parser returns Failure(TECHNICAL_ERROR)
-        WHEN run_pipeline is called
-        THEN pipeline returns Failure(TECHNICAL_ERROR).
-        """
-        access_tp = _make_access_token_provider(Result.success("token"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.success(b"corrupt"))
-        parser = _make_parser(Result.failure(ErrorCode.TECHNICAL_ERROR, "Invalid CMS"))
-        repository = _make_repository(Result.success(0))
-
-        result = run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
-
-        ResultAssertions.assert_failure(result, ErrorCode.TECHNICAL_ERROR)
-
-
-class TestPipelineStoreFailure:
-    """
-    GIVEN database store fails
-    WHEN run_pipeline is called
-    THEN it returns Result.failure(DATABASE_ERROR).
-    """
-
-    def test_returns_database_error(self) -> None:
-        """
-        GIVEN repository returns Failure(DATABASE_ERROR)
-        WHEN run_pipeline is called
-        THEN pipeline returns Failure(DATABASE_ERROR).
-        """
-        access_tp = _make_access_token_provider(Result.success("token"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.success(b"data"))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(
-            Result.failure(ErrorCode.DATABASE_ERROR, "connection refused")
-        )
-
-        result = run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
+# ─────────────────────── Short-Circuit Behavior ───────────────────────
 
-        ResultAssertions.assert_failure(result, ErrorCode.DATABASE_ERROR)
 
-
-# ─────────────────────── Short-Circuit Behavior ───────────────────────
+# Failing stage → the later stages that must never run.
+SHORT_CIRCUITS = [
+    pytest.param("access", ["sfc", "download", "parse", "store"], id="access_token"),
+    pytest.param("sfc", ["download", "parse", "store"], id="sfc_token"),
+    pytest.param("download", ["parse", "store"], id="download"),
+    pytest.param("parse", ["store"], id="parse"),
+]
 
 
 class TestPipelineShortCircuit:
@@ -310,76 +218,18 @@ class TestPipelineShortCircuit:
     THEN subsequent stages are NOT called.
     """
 
-    def test_access_token_failure_skips_all_subsequent(self) -> None:
-        """
-        GIVEN access_token_provider fails
-        WHEN run_pipeline is called
-        THEN sfc_token, download, parse, and store are never called.
-        """
-        access_tp = _make_access_token_provider(
-            Result.failure(ErrorCode.AUTHENTICATION_ERROR, "bad creds")
-        )
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.success(b""))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(0))
-
-        run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
-
-        sfc_tp.acquire_token.assert_not_called()
-        downloader.download.assert_not_called()
-        parser.parse.assert_not_called()
-        repository.store.assert_not_called()
-
-    def test_sfc_token_failure_skips_download_parse_store(self) -> None:
-        """
-        GIVEN sfc_token_provider fails
-        WHEN run_pipeline is called
-        THEN download, parse, and store are never called.
-        """
-        access_tp = _make_access_token_provider(Result.success("token"))
-        sfc_tp = _make_sfc_token_provider(
-            Result.failure(ErrorCode.AUTHENTICATION_ERROR, "SFC login failed")
-        )
-        downloader = _make_downloader(Result.success(b""))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(0))
-
-        run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
-
-        downloader.download.assert_not_called()
-        parser.parse.assert_not_called()
-        repository.store.assert_not_called()
-
-    def test_download_failure_skips_parse_store(self) -> None:
-        """
-        GIVEN downloader fails
-        WHEN run_pipeline is called
-        THEN parse and store are never called.
-        """
-        access_tp = _make_access_token_provider(Result.success("token"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.failure(ErrorCode.EXTERNAL_SERVICE_ERROR, "503"))
-        parser = _make_parser(Result.success(_sample_payload()))
-        repository = _make_repository(Result.success(0))
-
-        run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
-
-        parser.parse.assert_not_called()
-        repository.store.assert_not_called()
-
-    def test_parse_failure_skips_store(self) -> None:
+    @pytest.mark.parametrize(("failing_stage", "skipped_stages"), SHORT_CIRCUITS)
+    def test_failure_skips_later_stages(
+        self, ports: SimpleNamespace, failing_stage: str, skipped_stages: list[str]
+    ) -> None:
         """
-        GIVEN parser fails
+        GIVEN the port for failing_stage fails
         WHEN run_pipeline is called
-        THEN store is never called.
+        THEN none of the skipped_stages ports are called.
         """
-        access_tp = _make_access_token_provider(Result.success("token"))
-        sfc_tp = _make_sfc_token_provider(Result.success("sfc"))
-        downloader = _make_downloader(Result.success(b"data"))
-        parser = _make_parser(Result.failure(ErrorCode.TECHNICAL_ERROR, "corrupt CMS"))
-        repository = _make_repository(Result.success(0))
+        _stage_method(ports, failing_stage).return_value = _FAIL_STAGE
 
-        run_pipeline(access_tp, sfc_tp, downloader, parser, repository)
+        _run(ports)
 
-        repository.store.assert_not_called()
+        for stage in skipped_stages:
+            _stage_method(ports, stage).assert_not_called()
@@ -0,0 +1,69 @@
+"""
+Unit tests for PsycopgCertificateRepository — failure handling without a database.
+
+The repository borrows connections from an injected pool, so a fake pool
+lets these tests drive the error path and shutdown without Docker or a
+network connect. Storage behaviour against real PostgreSQL lives in
+tests/integration/test_repository.py.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import psycopg
+from railway import ErrorCode, ResultAssertions
+
+from cert_parser.adapters.repository import PsycopgCertificateRepository
+from cert_parser.domain.models import CertificateRecord, MasterListPayload
+
+# ─────────────────────── Helpers ───────────────────────
+
+
+def _unreachable_pool() -> MagicMock:
+    """Create a fake pool whose connection() fails like an unreachable server."""
+    pool = MagicMock()
+    pool.connection.side_effect = psycopg.OperationalError("connection refused")
+    return pool
+
+
+class TestStoreConnectionFailure:
+    """Verify connection errors become Result failures at the adapter boundary."""
+
+    def test_store_with_unreachable_database_returns_failure(self) -> None:
+        """
+        GIVEN a repository whose pool cannot hand out a connection
+        WHEN store is called
+        THEN it returns a Failure with DATABASE_ERROR (no exception escapes).
+        """
+        repo = PsycopgCertificateRepository("postgresql://unused", pool=_unreachable_pool())
+        payload = MasterListPayload(root_cas=[CertificateRecord(certificate=b"\x30\x00")])
+
+        result = repo.store(payload)
+
+        ResultAssertions.assert_failure(result, ErrorCode.DATABASE_ERROR)
+
+
+class TestClose:
+    """Verify pool ownership on shutdown."""
+
+    def test_close_closes_injected_pool(self) -> None:
+        """
+        GIVEN a repository built with a connection pool
+        WHEN close is called
+        THEN the pool is closed.
+        """
+        pool = MagicMock()
+        repo = PsycopgCertificateRepository("postgresql://unused", pool=pool)
+
+        repo.close()
+
+        pool.close.assert_called_once_with()
+
+    def test_close_without_pool_is_a_no_op(self) -> None:
+        """
+        GIVEN a repository that opens a connection per store
+        WHEN close is called
+        THEN nothing happens (no error).
+        """
+        PsycopgCertificateRepository("postgresql://unused").close()
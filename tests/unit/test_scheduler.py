@@ -7,13 +7,32 @@ and signal handler registration without starting the blocking loop.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import signal
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
+import pytest
 from apscheduler.triggers.cron import CronTrigger
 from railway import ErrorCode
 from railway.result import Result
 
-from cert_parser.scheduler import create_scheduler
+from cert_parser.scheduler import create_async_scheduler, create_scheduler
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.blocking import BlockingScheduler
+
+_OK = Result.success(5)
+
+
+def _make_scheduler(
+    *,
+    run_on_startup: bool,
+    cron: str = "0 */6 * * *",
+    result: Result[int] = _OK,
+) -> tuple[MagicMock, BlockingScheduler]:
+    """Build a blocking scheduler around a mock pipeline returning `result`."""
+    pipeline_fn = MagicMock(return_value=result)
+    return pipeline_fn, create_scheduler(pipeline_fn, cron=cron, run_on_startup=run_on_startup)
 
 
 class TestCreateScheduler:
@@ -25,8 +44,7 @@ class TestCreateScheduler:
         WHEN create_scheduler is called
         THEN the returned scheduler has exactly one job configured.
         """
-        pipeline_fn = MagicMock(return_value=Result.success(5))
-        scheduler = create_scheduler(pipeline_fn, cron="0 */12 * * *", run_on_startup=False)
+        _, scheduler = _make_scheduler(cron="0 */12 * * *", run_on_startup=False)
 
         jobs = scheduler.get_jobs()
         assert len(jobs) == 1
@@ -38,60 +56,117 @@ class TestCreateScheduler:
         WHEN create_scheduler is called
         THEN the job trigger is a CronTrigger (not IntervalTrigger).
         """
-        pipeline_fn = MagicMock(return_value=Result.success(5))
-        scheduler = create_scheduler(pipeline_fn, cron="0 2 * * *", run_on_startup=False)
+        _, scheduler = _make_scheduler(cron="0 2 * * *", run_on_startup=False)
 
         job = scheduler.get_jobs()[0]
         assert isinstance(job.trigger, CronTrigger)
 
-    def test_run_on_startup_executes_pipeline_immediately(self) -> None:
+    def test_run_on_startup_queues_startup_job(self) -> None:
         """
         GIVEN run_on_startup=True
         WHEN create_scheduler is called
-        THEN the pipeline function is executed once immediately.
+        THEN a one-off startup job is queued and the pipeline is NOT run inline.
         """
-        pipeline_fn = MagicMock(return_value=Result.success(10))
-        create_scheduler(pipeline_fn, run_on_startup=True)
+        pipeline_fn, scheduler = _make_scheduler(run_on_startup=True)
 
-        pipeline_fn.assert_called_once()
+        pipeline_fn.assert_not_called()
+        assert "cert_parser_startup" in {job.id for job in scheduler.get_jobs()}
+
+    def test_startup_job_is_never_dropped_as_missed(self) -> None:
+        """
+        GIVEN run_on_startup=True
+        WHEN create_scheduler is called
+        THEN the startup job has no misfire grace limit and coalesces, so a
+        scheduler that starts late still runs it once.
+        """
+        _, scheduler = _make_scheduler(run_on_startup=True)
+
+        job = scheduler.get_job("cert_parser_startup")
+        assert job.misfire_grace_time is None
+        assert job.coalesce is True
 
     def test_run_on_startup_false_does_not_execute(self) -> None:
         """
         GIVEN run_on_startup=False
         WHEN create_scheduler is called
-        THEN the pipeline function is NOT executed.
+        THEN the pipeline function is NOT executed and no startup job is queued.
         """
-        pipeline_fn = MagicMock(return_value=Result.success(0))
-        create_scheduler(pipeline_fn, run_on_startup=False)
+        pipeline_fn, scheduler = _make_scheduler(run_on_startup=False)
 
         pipeline_fn.assert_not_called()
+        assert "cert_parser_startup" not in {job.id for job in scheduler.get_jobs()}
 
     def test_startup_handles_pipeline_failure(self) -> None:
         """
         GIVEN a pipeline that returns Failure
-        WHEN run_on_startup executes
-        THEN the scheduler is still created (no crash).
+        WHEN the queued startup job runs
+        THEN it logs the failure without raising.
         """
-        pipeline_fn = MagicMock(
-            return_value=Result.failure(ErrorCode.EXTERNAL_SERVICE_ERROR, "HTTP 500")
+        pipeline_fn, scheduler = _make_scheduler(
+            run_on_startup=True,
+            result=Result.failure(ErrorCode.EXTERNAL_SERVICE_ERROR, "HTTP 500"),
         )
-        scheduler = create_scheduler(pipeline_fn, run_on_startup=True)
+
+        scheduler.get_job("cert_parser_startup").func()
 
         pipeline_fn.assert_called_once()
-        assert scheduler is not None
 
-    @patch("cert_parser.scheduler.signal.signal")
-    def test_registers_signal_handlers(self, mock_signal: MagicMock) -> None:
+    def test_registers_signal_handlers(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """
         GIVEN a pipeline function
         WHEN create_scheduler is called
         THEN SIGINT and SIGTERM handlers are registered.
         """
-        import signal
+        registered: list[int] = []
+        monkeypatch.setattr(
+            "cert_parser.scheduler.signal.signal", lambda sig, handler: registered.append(sig),
+        )
+
+        _make_scheduler(run_on_startup=False)
+
+        assert {signal.SIGINT, signal.SIGTERM} <= set(registered)
+
+
+class TestCreateAsyncScheduler:
+    """Verify the ASGI scheduler factory configuration."""
+
+    def test_uses_same_cron_job(self) -> None:
+        """
+        GIVEN a pipeline function and cron expression
+        WHEN create_async_scheduler is called without a startup run
+        THEN the scheduler has exactly the cron-triggered sync job.
+        """
+        pipeline_fn = MagicMock(return_value=Result.success(5))
+        scheduler = create_async_scheduler(pipeline_fn, cron="0 2 * * *", run_on_startup=False)
+
+        jobs = scheduler.get_jobs()
+        assert [job.id for job in jobs] == ["cert_parser_sync"]
+        assert isinstance(jobs[0].trigger, CronTrigger)
+
+    def test_run_on_startup_queues_job_instead_of_running_inline(self) -> None:
+        """
+        GIVEN run_on_startup=True
+        WHEN create_async_scheduler is called
+        THEN a one-off startup job is queued and the pipeline is NOT run inline.
+        """
+        pipeline_fn = MagicMock(return_value=Result.success(10))
+        scheduler = create_async_scheduler(pipeline_fn, run_on_startup=True)
+
+        pipeline_fn.assert_not_called()
+        assert "cert_parser_startup" in {job.id for job in scheduler.get_jobs()}
+
+    def test_does_not_register_signal_handlers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        GIVEN the scheduler runs inside Uvicorn
+        WHEN create_async_scheduler is called
+        THEN no signal handlers are installed (Uvicorn owns SIGINT/SIGTERM).
+        """
+        registered: list[int] = []
+        monkeypatch.setattr(
+            "cert_parser.scheduler.signal.signal", lambda sig, handler: registered.append(sig),
+        )
 
         pipeline_fn = MagicMock(return_value=Result.success(0))
-        create_scheduler(pipeline_fn, run_on_startup=False)
+        create_async_scheduler(pipeline_fn, run_on_startup=False)
 
-        calls = {call.args[0] for call in mock_signal.call_args_list}
-        assert signal.SIGINT in calls
-        assert signal.SIGTERM in calls
+        assert registered == []